@@ -7,10 +7,13 @@ import argparse
 import os
 import sys
 import time
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import multiprocessing
 
+from pdf_cracker.core import hashcat
+from pdf_cracker.core.candidate_order import parse_date_range
 from pdf_cracker.core.cracker import PDFCracker
+from pdf_cracker.core.encryption import StandardSecurityHandler
 from pdf_cracker.core.generator import (
     NumericPasswordGenerator,
     AlphabeticPasswordGenerator,
@@ -23,6 +26,14 @@ from pdf_cracker.utils.logger import Logger
 from pdf_cracker.utils.exceptions import PDFCrackerError
 
 
+def date_range_type(value: str) -> Tuple[int, int]:
+    """Parse a --date-range value for argparse"""
+    try:
+        return parse_date_range(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the command-line argument parser"""
     parser = argparse.ArgumentParser(
@@ -43,6 +54,11 @@ def create_parser() -> argparse.ArgumentParser:
         default=["smart", "numeric"],
         help="Types of passwords to try",
     )
+    generator_group.add_argument(
+        "--keep-order",
+        action="store_true",
+        help="Try password types in the given order instead of cheapest first",
+    )
     generator_group.add_argument(
         "-d", "--digits", type=int, help="Exact number of digits/characters to try"
     )
@@ -78,6 +94,12 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include symbols in alphanumeric passwords",
     )
+    generator_group.add_argument(
+        "--date-range",
+        type=date_range_type,
+        metavar="YYYY-YYYY",
+        help="Years to try dates from in smart passwords (default: 1950 to this year)",
+    )
 
     # Performance options
     performance_group = parser.add_argument_group("Performance Options")
@@ -94,8 +116,13 @@ def create_parser() -> argparse.ArgumentParser:
         "-s",
         "--save-interval",
         type=float,
-        default=5.0,
-        help="Interval in seconds between saving state",
+        default=60.0,
+        help="Interval in seconds between saving state (state is also saved on exit)",
+    )
+    performance_group.add_argument(
+        "--gpu",
+        action="store_true",
+        help="Run numeric searches with hashcat on the GPU when it is installed",
     )
 
     # State management
@@ -116,6 +143,11 @@ def create_parser() -> argparse.ArgumentParser:
     )
     output_group.add_argument("--log-file", help="Save log output to this file")
     output_group.add_argument("--output-file", help="Save found password to this file")
+    output_group.add_argument(
+        "--print-hash",
+        action="store_true",
+        help="Print the PDF's hash in hashcat format and exit",
+    )
     output_group.add_argument(
         "-q", "--quiet", action="store_true", help="Suppress standard output messages"
     )
@@ -201,6 +233,10 @@ def update_cracker_from_args(cracker: PDFCracker, args, config: Config) -> None:
     elif config.get("batch_size"):
         cracker.batch_size = config.get("batch_size")
 
+    # Set strategy order
+    if hasattr(args, "keep_order"):
+        cracker.preserve_strategy_order = args.keep_order
+
     # Set save interval
     if hasattr(args, "save_interval"):
         cracker.save_interval = args.save_interval
@@ -229,6 +265,22 @@ def main() -> int:
         # Show system information
         print_system_info(logger)
 
+        # Export the hash for external tools if requested
+        if hasattr(args, "print_hash") and args.print_hash:
+            security_handler = StandardSecurityHandler.from_pdf(args.pdf_file)
+            if not hashcat.supports(security_handler):
+                logger.error("Error: This PDF's encryption cannot be exported for hashcat")
+                return 1
+            mode, hash_line = hashcat.hashcat_hash(security_handler)
+            print(hash_line)
+            logger.info(f"Crack it with: hashcat -m {mode} -a 3 <hash file> <mask>")
+            return 0
+
+        # --gpu only works through hashcat; don't quietly fall back to the CPU
+        if hasattr(args, "gpu") and args.gpu and hashcat.find_hashcat() is None:
+            logger.error("Error: --gpu needs hashcat installed and on PATH")
+            return 1
+
         # Save configuration if requested
         if hasattr(args, "save_config") and args.save_config:
             save_config_from_args(args, config)
@@ -286,6 +338,8 @@ def main() -> int:
             exact_length=exact_length,
             dictionary_path=dictionary_path,
             ignore_state=args.ignore_state if hasattr(args, "ignore_state") else False,
+            use_gpu=args.gpu if hasattr(args, "gpu") else False,
+            date_range=args.date_range if hasattr(args, "date_range") else None,
         )
 
         # Display results
@@ -365,6 +419,12 @@ def display_examples():
         "Try multiple password types:",
         "  pdf-cracker document.pdf -t numeric alphanumeric",
         "",
+        "Use hashcat on the GPU for numeric passwords:",
+        "  pdf-cracker document.pdf -t numeric -d 8 --gpu",
+        "",
+        "Try smart passwords with dates from a range of years:",
+        "  pdf-cracker document.pdf -t smart --date-range 1970-2000",
+        "",
         "Dictionary-based attack:",
         "  pdf-cracker document.pdf -t dictionary --dictionary wordlist.txt",
         "",
@@ -3,6 +3,8 @@ Core functionality for the PDF Password Cracker.
 """
 
 from .cracker import PDFCracker
+from .encparse import parse_encrypt
+from .encryption import StandardSecurityHandler
 from .generator import (
     PasswordGenerator, 
     NumericPasswordGenerator,
@@ -13,4 +15,4 @@ from .generator import (
     SmartPasswordGenerator
 )
 from .state import StateManager
-from .worker import attempt_password, worker_process, PasswordTester
\ No newline at end of file
+from .worker import attempt_password, find_password, init_worker, worker_process, PasswordTester
\ No newline at end of file
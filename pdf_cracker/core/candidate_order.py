@@ -0,0 +1,102 @@
+"""
+Likelihood ordering of numeric password candidates.
+
+Human-chosen numeric passwords cluster around a few patterns. This module
+yields those patterns first so that a search finds them long before an
+exhaustive scan would.
+"""
+
+import calendar
+import datetime
+from typing import Iterator, Optional, Tuple
+
+
+# Oldest year used for dates when no range is given
+DEFAULT_FIRST_YEAR = 1950
+
+# Hand-picked sequences that are common but do not follow a simple rule
+COMMON_SEQUENCES = [
+    "123123", "112233", "121212", "123321", "654321",
+    "789456", "456789", "147258", "258369", "159753",
+]
+
+# Zero-padded 00-99, so dates are built by concatenation instead of formatting
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+
+
+def default_date_range() -> Tuple[int, int]:
+    """Get the default (first year, last year) range, ending this year"""
+    return DEFAULT_FIRST_YEAR, datetime.date.today().year
+
+
+def parse_date_range(value: str) -> Tuple[int, int]:
+    """Parse a "YYYY-YYYY" year range
+
+    Args:
+        value: Range string, e.g. "1970-2010"
+
+    Returns:
+        Tuple of (first year, last year)
+    """
+    parts = value.split("-")
+    if len(parts) != 2 or not all(len(part) == 4 and part.isdigit() for part in parts):
+        raise ValueError(f"Date range must look like YYYY-YYYY: {value}")
+    first_year, last_year = int(parts[0]), int(parts[1])
+    if first_year > last_year:
+        raise ValueError(f"Date range starts after it ends: {value}")
+    return first_year, last_year
+
+
+def _pattern_candidates() -> Iterator[str]:
+    """Repeated digits, runs and other keyboard-style sequences"""
+    for length in range(4, 9):
+        for digit in "0123456789":
+            yield digit * length
+        yield "".join(str(i % 10) for i in range(1, length + 1))
+        yield "".join(str(i % 10) for i in range(length))
+        yield "".join(str(9 - (i % 10)) for i in range(length))
+    yield from COMMON_SEQUENCES
+
+
+def _date_candidates(first_year: int, last_year: int) -> Iterator[str]:
+    """Years on their own, then full dates, most recent year first"""
+    years = range(last_year, first_year - 1, -1)
+    for year in years:
+        yield f"{year}"
+
+    for year in years:
+        long_year = str(year)
+        short_year = _TWO_DIGITS[year % 100]
+        for month in range(1, 13):
+            mm = _TWO_DIGITS[month]
+            for dd in _TWO_DIGITS[1:calendar.monthrange(year, month)[1] + 1]:
+                yield long_year + mm + dd
+                yield dd + mm + long_year
+                yield mm + dd + long_year
+                yield dd + mm + short_year
+                yield mm + dd + short_year
+
+
+def _low_number_candidates() -> Iterator[str]:
+    """Round numbers, then every number below 10000 without padding"""
+    for multiplier in (1000, 100):
+        for i in range(1, 10):
+            yield str(i * multiplier)
+    for i in range(10000):
+        yield str(i)
+
+
+def smart_order(date_range: Optional[Tuple[int, int]] = None) -> Iterator[str]:
+    """Yield numeric password candidates, most likely first
+
+    Patterns come first, then dates inside date_range, then low numbers. The
+    same string may be yielded more than once (e.g. "111111" is also a date).
+
+    Args:
+        date_range: Tuple of (first year, last year) for dates
+            (default: DEFAULT_FIRST_YEAR to this year)
+    """
+    first_year, last_year = date_range or default_date_range()
+    yield from _pattern_candidates()
+    yield from _date_candidates(first_year, last_year)
+    yield from _low_number_candidates()
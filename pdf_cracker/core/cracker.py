@@ -6,8 +6,12 @@ This module provides the main PDFCracker class that coordinates the cracking pro
 
 import multiprocessing
 import os
+import pickle
+import queue
 import time
 import signal
+import sys
+import threading
 from typing import Optional, Dict, Any, List, Tuple, Type, Union, Callable
 import pikepdf
 from tqdm import tqdm
@@ -19,12 +23,41 @@ from .generator import (
     AlphabeticPasswordGenerator,
     AlphanumericPasswordGenerator
 )
+from . import _hotloop, hashcat
+from .encparse import parse_encrypt
+from .encryption import StandardSecurityHandler
 from .state import StateManager
-from .worker import worker_process
-from pdf_cracker.utils.exceptions import PDFNotFoundError, PDFNotEncryptedError
+from .worker import COUNTER_STRIDE, attempt_password, init_worker, load_run, worker_process
+from pdf_cracker.utils.exceptions import HashcatError, PDFNotFoundError, PDFNotEncryptedError, StateIOError
 from pdf_cracker.utils.logger import Logger
 
 
+# Smallest batch the adaptive sizing will choose
+MIN_BATCH_SIZE = 256
+
+# Order crack_with_strategy tries strategies in: small, likely lists first,
+# then brute-force spaces by how fast they grow with length
+STRATEGY_PRIORITY = {
+    'smart': 0,
+    'dictionary': 1,
+    'numeric': 2,
+    'alphabetic': 3,
+    'alphanumeric': 4,
+}
+
+
+def _pool_context():
+    """Get the multiprocessing context to start workers with
+    
+    Forked workers inherit the imported modules and any compiled numeric
+    scanner from the parent, so prefer fork on Linux, where it is safe, even
+    when the interpreter defaults to another start method.
+    """
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
 class PDFCracker:
     """Main class for cracking PDF passwords"""
     
@@ -55,19 +88,75 @@ class PDFCracker:
         
         # Set default values
         self.batch_size = 10000
-        self.save_interval = 5  # seconds
+        self.target_batch_seconds = 0.25  # wall time per batch once speed is known
+        self.save_interval = 60  # seconds; state is also saved on exit
+        self.progress_interval = 0.5  # seconds
+        self.description_interval = 0.25  # seconds between progress text refreshes
+        self.preserve_strategy_order = False  # try strategies cheapest first unless set
         self.progress_bar = None
-        self.active_processes = []
+        self.pool = None
+        self._keep_pool = False
+        self._progress_counters = None
+        self._found_flag = None
         self.current_position = 0
         self.total_passwords_tried = 0
         self.start_time = 0
+        # Position and tried count the current run started from, for saving
+        # only the work below current_position
+        self._run_start_position = 0
+        self._run_start_tried = 0
+        self.security_handler = None
+        self._security_handler_loaded = False
+        self._is_protected = None
+        self.generator_type = None
+        self.generator_params = None
+        
+        # Periodic saves are written by a background thread; the slot holds
+        # only the newest state waiting to be written
+        self._save_slot = queue.Queue(maxsize=1)
+        self._save_thread = None
         
         # Signal handling
         self.original_sigint_handler = None
+        self.original_sigterm_handler = None
         
     def is_password_protected(self) -> bool:
         """Check if the PDF is actually password protected
         
+        The encryption dictionary is read directly; pikepdf is only opened when
+        it cannot be parsed or uses a handler we do not implement. The answer
+        is cached, since every crack() call asks again.
+        
+        Returns:
+            True if the PDF is password protected, False otherwise
+        """
+        if self._is_protected is None:
+            self._is_protected = self._check_password_protected()
+        return self._is_protected
+        
+    def _check_password_protected(self) -> bool:
+        """Read the encryption dictionary to decide whether a password is needed
+        
+        Returns:
+            True if the PDF is password protected, False otherwise
+        """
+        try:
+            encrypt = parse_encrypt(self.pdf_path)
+        except (OSError, ValueError):
+            return self._open_without_password()
+        if encrypt is None:
+            return False
+        
+        security_handler = self._load_security_handler(encrypt)
+        if security_handler is None:
+            return self._open_without_password()
+        
+        # An empty user password opens the PDF without asking for one
+        return not security_handler.check_password(b"")
+        
+    def _open_without_password(self) -> bool:
+        """Check with pikepdf whether the PDF needs a password to open
+        
         Returns:
             True if the PDF is password protected, False otherwise
         """
@@ -80,6 +169,66 @@ class PDFCracker:
             self.logger.error(f"Error checking PDF: {str(e)}")
             raise
             
+    def _load_security_handler(self, encrypt: Optional[Dict[str, Any]] = None) -> Optional[StandardSecurityHandler]:
+        """Parse the encryption dictionary once for direct password checks
+        
+        Args:
+            encrypt: Already parsed encryption dictionary (default: read from the PDF)
+        
+        Returns:
+            The security handler, or None if passwords must be checked with pikepdf
+        """
+        if not self._security_handler_loaded:
+            self._security_handler_loaded = True
+            if encrypt is not None:
+                self.security_handler = StandardSecurityHandler.from_dict(encrypt)
+            else:
+                self.security_handler = StandardSecurityHandler.from_pdf(self.pdf_path)
+            if self.security_handler:
+                self.logger.info(f"Checking passwords directly (security handler revision {self.security_handler.revision})")
+            else:
+                self.logger.info("Unsupported encryption, checking passwords with pikepdf")
+        return self.security_handler
+            
+    def _can_use_hashcat(self) -> bool:
+        """Check whether numeric searches can be handed to hashcat"""
+        if hashcat.find_hashcat() is None:
+            self.logger.warning("hashcat not found on PATH, using the CPU")
+            return False
+        if not hashcat.supports(self._load_security_handler()):
+            self.logger.warning("hashcat cannot crack this PDF's encryption, using the CPU")
+            return False
+        return True
+        
+    def crack_with_hashcat(self, length: int) -> Optional[str]:
+        """Search all numeric passwords of one length with hashcat on the GPU
+        
+        Args:
+            length: Number of digits
+            
+        Returns:
+            The found password or None if not found
+        """
+        if not self.is_password_protected():
+            raise PDFNotEncryptedError("This PDF is not password protected!")
+        
+        start_time = time.time()
+        password = hashcat.crack_numeric(self._load_security_handler(), length)
+        
+        # Confirm the result the same way the CPU path does
+        if password is not None and not attempt_password(self.pdf_path, password):
+            raise HashcatError(f"hashcat reported a password that does not open the PDF: {password}")
+        
+        self.logger.info(f"hashcat searched {10 ** length:,} passwords in {time.time() - start_time:.2f} seconds")
+        if password is not None:
+            self._save_found_password(password)
+        return password
+        
+    def _save_found_password(self, password: str) -> None:
+        """Write the found password next to the working directory"""
+        with open("found_password.txt", "w") as f:
+            f.write(f"PDF: {self.pdf_path}\nPassword: {password}")
+        
     def _calculate_optimal_batch_size(self, total_passwords: int) -> int:
         """Calculate an optimal batch size based on total passwords and CPU count
         
@@ -101,50 +250,176 @@ class PDFCracker:
         
         return batch_size
         
+    def _batch_size_for_speed(self, speed: float, total_passwords: int) -> int:
+        """Calculate a batch size that takes about target_batch_seconds per worker
+        
+        Args:
+            speed: Measured passwords per second across all workers
+            total_passwords: Total number of passwords to try
+            
+        Returns:
+            Batch size for the next batches
+        """
+        batch_size = int(speed * self.target_batch_seconds / self.processes)
+        
+        # Keep several batches per process so the pool stays busy to the end
+        batch_size = min(batch_size, total_passwords // (self.processes * 4))
+        
+        return max(MIN_BATCH_SIZE, batch_size)
+        
     def _setup_signal_handlers(self):
         """Set up signal handlers to gracefully handle interruptions"""
-        # Save original handler to restore later
+        # Save original handlers to restore later
         self.original_sigint_handler = signal.getsignal(signal.SIGINT)
+        self.original_sigterm_handler = signal.getsignal(signal.SIGTERM)
+        
+        interrupted = False
         
         def sigint_handler(sig, frame):
-            """Handle Ctrl+C by saving state and exiting"""
-            self.logger.info("\nInterrupted by user. Saving state and cleaning up...")
-            self._save_current_state()
-            self._cleanup_processes()
-            # Restore original handler and re-raise the signal
-            signal.signal(signal.SIGINT, self.original_sigint_handler)
+            """Handle Ctrl+C or termination by stopping the run
+            
+            Only the first signal interrupts; crack() saves the state and
+            cleans up on the way out, outside the signal handler, where it
+            can safely wait for the save thread.
+            """
+            nonlocal interrupted
+            if interrupted:
+                return
+            interrupted = True
             raise KeyboardInterrupt
             
-        # Set custom handler
+        # Set custom handlers
         signal.signal(signal.SIGINT, sigint_handler)
+        signal.signal(signal.SIGTERM, sigint_handler)
         
     def _restore_signal_handlers(self):
         """Restore original signal handlers"""
         if self.original_sigint_handler:
             signal.signal(signal.SIGINT, self.original_sigint_handler)
+        if self.original_sigterm_handler:
+            signal.signal(signal.SIGTERM, self.original_sigterm_handler)
             
+    def _start_pool(self, run_args: Optional[tuple] = None):
+        """Start the worker pool and the shared state its workers use
+        
+        Args:
+            run_args: Arguments for the workers' first run (default: none,
+                runs are loaded later with _load_run)
+        """
+        context = _pool_context()
+        
+        # Progress is read from per-worker shared counters, each in its own cache line
+        self._progress_counters = context.RawArray('Q', self.processes * COUNTER_STRIDE)
+        slot_counter = context.Value('i', 0)
+        # Workers only need to see the found flag go from 0 to 1, so it needs no lock
+        self._found_flag = context.RawValue('b', 0)
+        run_barrier = context.Barrier(self.processes)
+        
+        # A kept pool may run numeric searches later; compile the native scan
+        # now so the workers inherit it rather than each compiling their own
+        security_handler = self._load_security_handler()
+        if self._keep_pool and _hotloop.supports(security_handler, 1):
+            _hotloop.NumericScanner(security_handler, 1).compile()
+        
+        # Forked workers inherit the run's state for free, but other start
+        # methods pickle initargs again for every worker, so there the run is
+        # pickled once and loaded into the started pool
+        deferred_run = None
+        if run_args is not None and context.get_start_method() != "fork":
+            deferred_run, run_args = run_args, None
+        
+        if run_args is None:
+            run_args = (self.pdf_path, None, None, 100, None)
+        pdf_path, generator, security_handler, report_frequency, numeric_scanner = run_args
+        self.pool = context.Pool(
+            self.processes,
+            initializer=init_worker,
+            initargs=(pdf_path, generator, security_handler, self._progress_counters,
+                      slot_counter, report_frequency, numeric_scanner, self._found_flag,
+                      run_barrier),
+        )
+        if deferred_run is not None:
+            self._load_run(deferred_run)
+        
+    def _load_run(self, run_args: tuple):
+        """Switch every worker of the running pool to a new run
+        
+        Args:
+            run_args: Arguments for the workers' new run
+        """
+        self._found_flag.value = 0
+        run_state = pickle.dumps(run_args, pickle.HIGHEST_PROTOCOL)
+        loads = [self.pool.apply_async(load_run, (run_state,)) for _ in range(self.processes)]
+        for result in loads:
+            result.get()
+        
     def _cleanup_processes(self):
-        """Terminate and clean up any active worker processes"""
-        for p in self.active_processes:
-            if p.is_alive():
-                p.terminate()
-                p.join(timeout=1)
-        self.active_processes = []
-        
-    def _save_current_state(self, generator_type=None, generator_params=None):
+        """Terminate and clean up the worker pool"""
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        
+    def _save_current_state(self, generator_type=None, generator_params=None, sync=False):
         """Save the current state
         
+        Periodic saves are handed to a background thread so slow storage does
+        not stall the progress loop; a newer state replaces one that has not
+        been written yet.
+        
         Args:
-            generator_type: Type of generator being used
-            generator_params: Dictionary of generator parameters
+            generator_type: Type of generator being used (default: the current run's)
+            generator_params: Dictionary of generator parameters (default: the current run's)
+            sync: Whether to write and fsync the state file before returning, for saves on exit
         """
-        self.state_manager.save_state(
-            generator_type=generator_type or "unknown",
-            generator_params=generator_params or {},
-            current_position=self.current_position,
-            passwords_tried=self.total_passwords_tried,
-            start_time=self.start_time
-        )
+        state = {
+            "generator_type": generator_type or self.generator_type or "unknown",
+            "generator_params": generator_params or self.generator_params or {},
+            "current_position": self.current_position,
+            # Batches still in flight above current_position are tried again
+            # on resume, so only the passwords below it count as tried
+            "passwords_tried": self._run_start_tried + self.current_position - self._run_start_position,
+            "start_time": self.start_time,
+        }
+        
+        if sync:
+            # Let any queued save finish first so it cannot overwrite this one
+            self._stop_save_thread()
+            self.state_manager.save_state(**state, sync=True)
+            return
+        
+        # Started on first use, after the pool has forked its workers
+        if self._save_thread is None:
+            self._save_thread = threading.Thread(target=self._save_loop, name="pdf_cracker-state", daemon=True)
+            self._save_thread.start()
+        
+        try:
+            self._save_slot.put_nowait(state)
+        except queue.Full:
+            # Drop the older state that is still waiting
+            try:
+                self._save_slot.get_nowait()
+            except queue.Empty:
+                pass
+            self._save_slot.put_nowait(state)
+            
+    def _save_loop(self):
+        """Write queued states until told to stop with None"""
+        while True:
+            state = self._save_slot.get()
+            if state is None:
+                return
+            try:
+                self.state_manager.save_state(**state)
+            except StateIOError as e:
+                self.logger.error(str(e))
+                
+    def _stop_save_thread(self):
+        """Write any queued state and stop the background save thread"""
+        if self._save_thread is not None:
+            self._save_slot.put(None)
+            self._save_thread.join()
+            self._save_thread = None
         
     def crack(self, 
              generator: PasswordGenerator,
@@ -167,6 +442,12 @@ class PDFCracker:
         self.logger.info(f"PDF is password protected. Starting to crack...")
         self.logger.info(f"Using {self.processes} CPU cores")
         
+        security_handler = self._load_security_handler()
+        
+        # Nothing to save on interruption until this run's state is known
+        self.generator_type = None
+        self.generator_params = None
+        
         # Set up signal handlers
         self._setup_signal_handlers()
         
@@ -175,23 +456,40 @@ class PDFCracker:
             total_passwords = generator.get_total_count()
             self.logger.info(f"Total possible passwords: {total_passwords:,}")
             
-            # Calculate optimal batch size
+            # Start from a size based on the password count; it is tuned to the
+            # measured speed once the first progress comes in
             self.batch_size = self._calculate_optimal_batch_size(total_passwords)
-            self.logger.info(f"Using batch size of {self.batch_size:,} passwords per process")
+            self.logger.info(f"Starting with batch size of {self.batch_size:,} passwords per process")
             
             # Get generator type and parameters for state management
             generator_type = generator.__class__.__name__
             generator_params = {
-                "total_count": generator.get_total_count(),
+                "total_count": total_passwords,
             }
             
-            # If numeric generator, add digit length
-            if isinstance(generator, NumericPasswordGenerator):
-                generator_params["length"] = generator.length
+            # Parameters that pin down the exact candidate list (length,
+            # character set, dictionary digest, date range). Without them a
+            # saved state may belong to a different list of the same size, so
+            # it is never taken to mean this run was already searched.
+            state_params = generator.get_state_params()
+            candidates_identified = state_params is not None
+            if candidates_identified:
+                generator_params.update(state_params)
+            
+            # Remembered so that saves from the signal handler use the right file
+            self.generator_type = generator_type
+            self.generator_params = generator_params
             
             # Check for saved state for this specific generator configuration
             resume_state = None if ignore_state else self.state_manager.load_state(generator_type, generator_params)
             
+            # A saved state at the end means this space was already searched,
+            # so skip starting workers for it
+            if (candidates_identified and resume_state and
+                    resume_state['current_position'] >= total_passwords):
+                self.logger.info(f"All {total_passwords:,} passwords were already tried in an earlier run, skipping")
+                return None
+            
             if resume_state and not ignore_state:
                 self.logger.info(f"Found saved state from {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(resume_state['timestamp']))}")
                 self.logger.info(f"Resuming from position {resume_state['current_position']:,}")
@@ -205,13 +503,14 @@ class PDFCracker:
                 self.start_time = time.time()
                 self.total_passwords_tried = 0
                 self.current_position = 0
+            self._run_start_position = self.current_position
+            self._run_start_tried = self.total_passwords_tried
             
             # Create progress bar
-            self.progress_bar = tqdm(total=total_passwords, initial=self.current_position, unit="pw")
+            self.progress_bar = tqdm(total=total_passwords, initial=self.current_position, unit="pw",
+                                     mininterval=self.description_interval, smoothing=0.1)
             
-            # Create queues for results and progress updates
-            result_queue = multiprocessing.Queue()
-            progress_queue = multiprocessing.Queue()
+            last_description_time = 0.0
             
             # Start with no password found
             found_password = None
@@ -219,74 +518,107 @@ class PDFCracker:
             # Calculate time for last state save
             last_save_time = time.time()
             
-            # Start initial batch of processes
-            for i in range(min(self.processes, (total_passwords - self.current_position + self.batch_size - 1) // self.batch_size)):
-                if self.current_position >= total_passwords:
-                    break
-                    
-                # Calculate how many passwords this batch will try
-                batch_count = min(self.batch_size, total_passwords - self.current_position)
-                
-                # Generate passwords for this batch
-                batch_passwords = generator.generate(self.current_position, batch_count)
-                
-                # Start a new process for this batch
-                p = multiprocessing.Process(
-                    target=worker_process,
-                    args=(self.pdf_path, batch_passwords, result_queue, progress_queue),
-                    kwargs={"worker_id": i}
-                )
-                p.start()
-                self.active_processes.append(p)
-                self.current_position += batch_count
+            # Numeric spaces can be scanned natively when Numba is installed;
+            # compile before forking so the workers inherit the machine code
+            numeric_scanner = None
+            report_frequency = 100
+            if (isinstance(generator, NumericPasswordGenerator) and
+                    _hotloop.supports(security_handler, generator.length)):
+                numeric_scanner = _hotloop.NumericScanner(security_handler, generator.length)
+                numeric_scanner.compile()
+                # Native chunks are cheap, so report less often
+                report_frequency = 4096
+                self.logger.info("Using native numeric scan")
+            
+            # One pool of workers for the whole run, or for every run of
+            # crack_with_strategy; each task carries only its batch position
+            run_args = (self.pdf_path, generator, security_handler, report_frequency, numeric_scanner)
+            if self.pool is None:
+                self._start_pool(run_args)
+            else:
+                self._load_run(run_args)
+            # The counters keep growing across the runs of a kept pool, so
+            # this run's progress and speed are measured from here
+            progress_counters = self._progress_counters
+            passwords_counted = sum(progress_counters[::COUNTER_STRIDE])
+            run_start_count = passwords_counted
+            
+            # Keep a bounded number of batches queued so huge password spaces
+            # are never enumerated up front
+            pending_batches = {}
+            next_position = self.current_position
+            max_pending = self.processes * 2
+            
+            # The pool's result thread posts each finished batch here, so the
+            # loop below blocks until there is something to do
+            completed_batches = queue.Queue()
+            
+            def submit_batches():
+                """Queue the next batches until the pool has enough work"""
+                nonlocal next_position
+                while next_position < total_passwords and len(pending_batches) < max_pending:
+                    batch_count = min(self.batch_size, total_passwords - next_position)
+                    notify = lambda _, start_pos=next_position: completed_batches.put(start_pos)
+                    pending_batches[next_position] = self.pool.apply_async(
+                        worker_process, (next_position, batch_count),
+                        callback=notify, error_callback=notify,
+                    )
+                    next_position += batch_count
+            
+            run_start_time = time.time()
+            submit_batches()
             
             # Process until we find the password or exhaust all possibilities
-            while self.active_processes and found_password is None:
-                # Check for results (non-blocking)
+            while pending_batches and found_password is None:
+                # Wait for a batch to finish, waking up to refresh progress
+                # or when the next state save is due
+                save_due = last_save_time + self.save_interval - time.time()
+                timeout = max(0.001, min(self.progress_interval, save_due))
+                finished = []
                 try:
-                    result = result_queue.get(block=False)
+                    finished.append(completed_batches.get(timeout=timeout))
+                except queue.Empty:
+                    pass
+                # This loop is the only consumer, so a non-empty queue cannot
+                # raise Empty here
+                while not completed_batches.empty():
+                    finished.append(completed_batches.get_nowait())
+                
+                # Collect finished batches
+                for start_pos in finished:
+                    result = pending_batches.pop(start_pos).get()
                     if result is not None:
                         found_password = result
                         break
-                        
-                    # A process finished with no success, remove it from active
-                    finished_processes = [p for p in self.active_processes if not p.is_alive()]
-                    for p in finished_processes:
-                        self.active_processes.remove(p)
-                    
-                    # Start new processes if we have more passwords to try
-                    while self.current_position < total_passwords and len(self.active_processes) < self.processes:
-                        batch_count = min(self.batch_size, total_passwords - self.current_position)
-                        batch_passwords = generator.generate(self.current_position, batch_count)
-                        
-                        p = multiprocessing.Process(
-                            target=worker_process,
-                            args=(self.pdf_path, batch_passwords, result_queue, progress_queue),
-                            kwargs={"worker_id": len(self.active_processes)}
-                        )
-                        p.start()
-                        self.active_processes.append(p)
-                        self.current_position += batch_count
-                except multiprocessing.queues.Empty:
-                    pass
+                if found_password is not None:
+                    break
+                submit_batches()
                 
-                # Update progress (non-blocking)
-                progress_received = 0
-                try:
-                    while True:
-                        progress = progress_queue.get(block=False)
-                        progress_received += progress
-                except multiprocessing.queues.Empty:
-                    pass
+                # Everything before the oldest unfinished batch has been tried
+                self.current_position = min(pending_batches) if pending_batches else next_position
+                
+                # Update progress from the shared counters
+                tried = sum(progress_counters[::COUNTER_STRIDE])
+                progress_received = tried - passwords_counted
+                passwords_counted = tried
+                
+                # Size the batches still to be queued from this run's speed, so
+                # a batch takes about the same time whatever the check costs
+                if progress_received > 0:
+                    run_speed = (passwords_counted - run_start_count) / (time.time() - run_start_time)
+                    self.batch_size = self._batch_size_for_speed(run_speed, total_passwords)
                 
                 # Update the progress bar and metrics
                 if progress_received > 0:
                     self.total_passwords_tried += progress_received
                     self.progress_bar.update(progress_received)
                     
-                    # Calculate and display speed and ETA
-                    elapsed = time.time() - self.start_time
-                    if elapsed > 0:
+                    # Calculate and display speed and ETA, at most every
+                    # description_interval however often batches finish
+                    now = time.time()
+                    elapsed = now - self.start_time
+                    if elapsed > 0 and now - last_description_time >= self.description_interval:
+                        last_description_time = now
                         speed = self.total_passwords_tried / elapsed
                         if speed > 1_000_000:
                             speed_str = f"{speed/1_000_000:.2f}M/s"
@@ -321,19 +653,21 @@ class PDFCracker:
                             progress_callback(progress_data)
                 
                 # Save state periodically
-                if time.time() - last_save_time > self.save_interval:
+                if time.time() - last_save_time >= self.save_interval:
                     # Save state with generator info
                     self._save_current_state(
-                        generator_type=generator.__class__.__name__,
+                        generator_type=generator_type,
                         generator_params=generator_params
                     )
                     last_save_time = time.time()
-                
-                # Short sleep to prevent CPU thrashing
-                time.sleep(0.01)
             
-            # Clean up any remaining processes
-            self._cleanup_processes()
+            # Clean up any remaining processes; a kept pool is reused once the
+            # batches still running have seen the found flag and returned
+            if self._keep_pool:
+                for result in pending_batches.values():
+                    result.wait()
+            else:
+                self._cleanup_processes()
             
             # Close the progress bar
             if self.progress_bar:
@@ -347,30 +681,52 @@ class PDFCracker:
                 self.logger.info(f"Passwords tried: {self.total_passwords_tried:,}")
                 
                 # Save the password to a file
-                with open("found_password.txt", "w") as f:
-                    f.write(f"PDF: {self.pdf_path}\nPassword: {found_password}")
+                self._save_found_password(found_password)
                 
-                # Remove state file since we found the password
+                # Remove state file since we found the password, after any
+                # queued save that would recreate it
+                self._stop_save_thread()
                 self.state_manager.delete_state(
-                    generator_type=generator.__class__.__name__,
+                    generator_type=generator_type,
                     generator_params=generator_params
                 )
                 
                 return found_password
             else:
+                # Record the finished search so a rerun skips straight past it,
+                # but only when the state says which candidates were searched
+                if candidates_identified:
+                    self._save_current_state(sync=True)
+                else:
+                    self._stop_save_thread()
+                    self.state_manager.delete_state(
+                        generator_type=generator_type,
+                        generator_params=generator_params
+                    )
+                
                 self.logger.warning("\nPASSWORD NOT FOUND after trying all combinations in this strategy!")
                 self.logger.info(f"Total passwords checked: {self.total_passwords_tried:,}")
                 self.logger.info(f"Total time spent: {time.time() - self.start_time:.2f} seconds")
                 self.logger.info(f"Average speed: {self.total_passwords_tried / (time.time() - self.start_time):.2f} passwords/second")
                 
                 return None
+        
+        except KeyboardInterrupt:
+            self.logger.info("\nInterrupted. Saving state and cleaning up...")
+            if self.generator_params is not None:
+                self._save_current_state(sync=True)
+            raise
                 
         finally:
             # Always restore signal handlers
             self._restore_signal_handlers()
             
+            # Finish writing any queued state
+            self._stop_save_thread()
+            
             # Make sure we clean up any active processes
-            self._cleanup_processes()
+            if not self._keep_pool:
+                self._cleanup_processes()
             
             # Make sure progress bar is closed
             if self.progress_bar:
@@ -383,23 +739,59 @@ class PDFCracker:
                            max_length: int = 6,
                            exact_length: Optional[int] = None,
                            dictionary_path: Optional[str] = None,
-                           ignore_state: bool = False) -> Optional[str]:
+                           ignore_state: bool = False,
+                           use_gpu: bool = False,
+                           date_range: Optional[Tuple[int, int]] = None) -> Optional[str]:
         """Crack a PDF using multiple strategies in sequence
         
         Args:
-            strategies: List of strategies to try ('numeric', 'smart', 'alphabetic', 'alphanumeric', 'dictionary')
+            strategies: List of strategies to try ('numeric', 'smart', 'alphabetic', 'alphanumeric', 'dictionary'),
+                sorted by STRATEGY_PRIORITY unless preserve_strategy_order is set
             min_length: Minimum password length
             max_length: Maximum password length
             exact_length: Exact password length (overrides min/max)
             dictionary_path: Path to dictionary file for dictionary strategy
             ignore_state: Whether to ignore saved state
+            use_gpu: Whether to run numeric searches with hashcat when it is available
+            date_range: Tuple of (first year, last year) for smart strategy dates
             
         Returns:
             The found password or None if not found
         """
+        # Check once up front, before building any generator; the runs below
+        # reuse the cached answer
+        if not self.is_password_protected():
+            self.logger.info("This PDF is not password protected!")
+            raise PDFNotEncryptedError("This PDF is not password protected!")
+        
+        # Keep one worker pool for all the CPU runs instead of one per run
+        self._keep_pool = True
+        try:
+            return self._crack_strategies(strategies, min_length, max_length, exact_length,
+                                          dictionary_path, ignore_state, use_gpu, date_range)
+        finally:
+            self._keep_pool = False
+            self._cleanup_processes()
+            
+    def _crack_strategies(self,
+                          strategies: Optional[List[str]],
+                          min_length: int,
+                          max_length: int,
+                          exact_length: Optional[int],
+                          dictionary_path: Optional[str],
+                          ignore_state: bool,
+                          use_gpu: bool,
+                          date_range: Optional[Tuple[int, int]]) -> Optional[str]:
+        """Try each strategy in sequence; see crack_with_strategy for the arguments"""
+        use_gpu = use_gpu and self._can_use_hashcat()
+        
         # Default strategies if none provided
         if not strategies:
             strategies = ['smart', 'numeric']
+        
+        # Cheap, likely strategies first; unknown names keep their place at the end
+        if not self.preserve_strategy_order:
+            strategies = sorted(strategies, key=lambda strategy: STRATEGY_PRIORITY.get(strategy, len(STRATEGY_PRIORITY)))
             
         # If exact length specified, override min/max
         if exact_length is not None:
@@ -411,12 +803,22 @@ class PDFCracker:
             
             if strategy == 'smart':
                 # Use smart password generator with common patterns
-                generator = SmartPasswordGenerator()
+                generator = SmartPasswordGenerator(date_range=date_range)
                 
             elif strategy == 'numeric':
                 # Try each length in sequence
                 for length in range(min_length, max_length + 1):
                     self.logger.info(f"Trying {length}-digit numeric passwords")
+                    if use_gpu:
+                        try:
+                            password = self.crack_with_hashcat(length)
+                        except HashcatError as e:
+                            self.logger.warning(f"{e}; falling back to the CPU")
+                            use_gpu = False
+                        else:
+                            if password:
+                                return password
+                            continue
                     generator = NumericPasswordGenerator(length)
                     password = self.crack(generator, ignore_state)
                     if password:
@@ -0,0 +1,401 @@
+"""
+Encryption dictionary parsing for the PDF Password Cracker.
+
+This module reads the /Encrypt dictionary and document ID of a PDF without a
+full parse. The file is memory-mapped and the trailer is located through
+startxref, so normally only the trailer and the encryption dictionary are
+touched; damaged or unusual files fall back to scanning the whole file.
+"""
+
+import mmap
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+_WHITESPACE = b"\x00\t\n\x0c\r "
+_DELIMITERS = b"()<>[]{}/%"
+_LITERAL_ESCAPES = {
+    ord("n"): b"\n",
+    ord("r"): b"\r",
+    ord("t"): b"\t",
+    ord("b"): b"\b",
+    ord("f"): b"\f",
+    ord("("): b"(",
+    ord(")"): b")",
+    ord("\\"): b"\\",
+}
+
+_ENCRYPT_REF_RE = re.compile(rb"/Encrypt\s*(\d+)\s+(\d+)\s+R")
+_ENCRYPT_DIRECT_RE = re.compile(rb"/Encrypt\s*<<")
+_ID_RE = re.compile(rb"/ID\s*\[")
+_REF_TAIL_RE = re.compile(rb"\s+(\d+)\s+R(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])")
+
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+_OBJECT_HEADER_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+_XREF_SUBSECTION_RE = re.compile(rb"\s*(\d+)\s+(\d+)[ \t]*(?:\r\n|\r|\n)")
+_XREF_ENTRY_RE = re.compile(rb"(\d{10}) \d{5} ([nf])")
+
+# startxref has to be within the last 1024 bytes of the file
+_TAIL_SIZE = 1024
+
+# Entries of the encryption dictionary that may be indirect objects
+_ENCRYPT_KEYS = ("/O", "/U", "/OE", "/UE", "/P", "/R", "/V", "/Length")
+
+
+class _PDFObjectParser:
+    """Minimal parser for the PDF objects found in an encryption dictionary"""
+
+    def __init__(self, data):
+        """Initialize with the raw PDF bytes or a memory map of the file"""
+        self.data = data
+
+    def skip_whitespace(self, pos: int) -> int:
+        """Skip whitespace and comments starting at pos"""
+        data = self.data
+        while pos < len(data):
+            if data[pos] in _WHITESPACE:
+                pos += 1
+            elif data[pos] == ord("%"):
+                while pos < len(data) and data[pos] not in b"\r\n":
+                    pos += 1
+            else:
+                break
+        return pos
+
+    def parse(self, pos: int) -> Tuple[Any, int]:
+        """Parse the object starting at pos
+
+        Returns:
+            Tuple of (parsed value, position after the object)
+        """
+        data = self.data
+        pos = self.skip_whitespace(pos)
+        if pos >= len(data):
+            raise ValueError("Unexpected end of data")
+
+        if data[pos:pos + 2] == b"<<":
+            return self._parse_dict(pos + 2)
+        char = data[pos]
+        if char == ord("<"):
+            return self._parse_hex_string(pos + 1)
+        if char == ord("("):
+            return self._parse_literal_string(pos + 1)
+        if char == ord("["):
+            return self._parse_array(pos + 1)
+        if char == ord("/"):
+            return self._parse_name(pos + 1)
+        return self._parse_token(pos)
+
+    def _parse_dict(self, pos: int) -> Tuple[Dict[str, Any], int]:
+        """Parse a dictionary body up to the closing '>>'"""
+        result = {}
+        while True:
+            pos = self.skip_whitespace(pos)
+            if self.data[pos:pos + 2] == b">>":
+                return result, pos + 2
+            key, pos = self.parse(pos)
+            if not isinstance(key, str) or not key.startswith("/"):
+                raise ValueError("Dictionary key must be a name")
+            value, pos = self.parse(pos)
+            result[key] = value
+
+    def _parse_array(self, pos: int) -> Tuple[list, int]:
+        """Parse an array body up to the closing ']'"""
+        result = []
+        while True:
+            pos = self.skip_whitespace(pos)
+            if pos >= len(self.data):
+                raise ValueError("Unterminated array")
+            if self.data[pos] == ord("]"):
+                return result, pos + 1
+            value, pos = self.parse(pos)
+            result.append(value)
+
+    def _parse_name(self, pos: int) -> Tuple[str, int]:
+        """Parse a name, returned with its leading slash"""
+        end = pos
+        data = self.data
+        while end < len(data) and data[end] not in _WHITESPACE and data[end] not in _DELIMITERS:
+            end += 1
+        return "/" + data[pos:end].decode("latin-1"), end
+
+    def _parse_hex_string(self, pos: int) -> Tuple[bytes, int]:
+        """Parse a hexadecimal string body up to the closing '>'"""
+        end = self.data.find(b">", pos)
+        if end < 0:
+            raise ValueError("Unterminated hex string")
+        digits = bytes(c for c in self.data[pos:end] if c not in _WHITESPACE)
+        if len(digits) % 2:
+            digits += b"0"
+        return bytes.fromhex(digits.decode("ascii")), end + 1
+
+    def _parse_literal_string(self, pos: int) -> Tuple[bytes, int]:
+        """Parse a literal string body up to the balancing ')'"""
+        data = self.data
+        result = bytearray()
+        depth = 1
+        while pos < len(data):
+            char = data[pos]
+            if char == ord("\\"):
+                pos += 1
+                if pos >= len(data):
+                    break
+                escaped = data[pos]
+                if escaped in _LITERAL_ESCAPES:
+                    result += _LITERAL_ESCAPES[escaped]
+                    pos += 1
+                elif ord("0") <= escaped <= ord("7"):
+                    end = pos
+                    while end < pos + 3 and end < len(data) and ord("0") <= data[end] <= ord("7"):
+                        end += 1
+                    result.append(int(data[pos:end], 8) & 0xFF)
+                    pos = end
+                elif escaped == ord("\r"):
+                    # Line continuation
+                    pos += 2 if data[pos + 1:pos + 2] == b"\n" else 1
+                elif escaped == ord("\n"):
+                    pos += 1
+                else:
+                    result.append(escaped)
+                    pos += 1
+                continue
+            if char == ord("("):
+                depth += 1
+            elif char == ord(")"):
+                depth -= 1
+                if depth == 0:
+                    return bytes(result), pos + 1
+            result.append(char)
+            pos += 1
+        raise ValueError("Unterminated literal string")
+
+    def _parse_token(self, pos: int) -> Tuple[Any, int]:
+        """Parse a number, boolean, null or indirect reference"""
+        data = self.data
+        end = pos
+        while end < len(data) and data[end] not in _WHITESPACE and data[end] not in _DELIMITERS:
+            end += 1
+        token = data[pos:end]
+        if not token:
+            raise ValueError(f"Unexpected character at offset {pos}")
+        if token == b"true":
+            return True, end
+        if token == b"false":
+            return False, end
+        if token == b"null":
+            return None, end
+
+        value = float(token) if b"." in token else int(token)
+
+        # Indirect reference: "<num> <gen> R"
+        match = _REF_TAIL_RE.match(data, end)
+        if isinstance(value, int) and match:
+            return ("ref", value, int(match.group(1))), match.end()
+        return value, end
+
+    def parse_object_at(self, offset: int, number: int, generation: int) -> Any:
+        """Parse an indirect object that the cross-reference table places at offset"""
+        match = _OBJECT_HEADER_RE.match(self.data, offset)
+        if not match or (int(match.group(1)), int(match.group(2))) != (number, generation):
+            raise ValueError(f"Object {number} {generation} not found at offset {offset}")
+        value, _ = self.parse(match.end())
+        return value
+
+    def find_object(self, number: int, generation: int) -> Any:
+        """Find and parse the last definition of an indirect object"""
+        pattern = re.compile(rb"(?<!\d)%d\s+%d\s+obj" % (number, generation))
+        match = None
+        for match in pattern.finditer(self.data):
+            pass
+        if match is None:
+            raise ValueError(f"Object {number} {generation} not found")
+        value, _ = self.parse(match.end())
+        return value
+
+
+class _CrossReference:
+    """Object offsets from the classic cross-reference tables of a PDF"""
+
+    def __init__(self, parser: _PDFObjectParser):
+        """Initialize with a parser over the whole file"""
+        self.parser = parser
+        self.subsections: List[Tuple[int, int, int]] = []
+
+    def read_section(self, pos: int) -> Dict[str, Any]:
+        """Index the table section at pos and return the trailer after it
+
+        Entries are decoded only on lookup, so reading a section does not
+        depend on the number of objects in the file.
+        """
+        data = self.parser.data
+        pos += len(b"xref")
+        while True:
+            match = _XREF_SUBSECTION_RE.match(data, pos)
+            if not match:
+                break
+            first, count = int(match.group(1)), int(match.group(2))
+            self.subsections.append((first, count, match.end()))
+            pos = match.end() + 20 * count
+
+        pos = self.parser.skip_whitespace(pos)
+        if data[pos:pos + 7] != b"trailer":
+            raise ValueError("Missing trailer after cross-reference table")
+        trailer, _ = self.parser.parse(pos + 7)
+        if not isinstance(trailer, dict):
+            raise ValueError("Trailer is not a dictionary")
+        return trailer
+
+    def offset(self, number: int) -> Optional[int]:
+        """Get the file offset of an object, newest section first"""
+        for first, count, pos in self.subsections:
+            if first <= number < first + count:
+                match = _XREF_ENTRY_RE.match(self.parser.data, pos + 20 * (number - first))
+                if not match:
+                    raise ValueError(f"Malformed cross-reference entry for object {number}")
+                return int(match.group(1)) if match.group(2) == b"n" else None
+        return None
+
+    def resolve(self, value: Any) -> Any:
+        """Replace an indirect reference with the object it points to"""
+        if not (isinstance(value, tuple) and value[0] == "ref"):
+            return value
+        offset = self.offset(value[1])
+        if offset is None:
+            return self.parser.find_object(value[1], value[2])
+        return self.parser.parse_object_at(offset, value[1], value[2])
+
+
+def _first_document_id(ids: Any) -> bytes:
+    """Get the first string of a trailer /ID array"""
+    if isinstance(ids, list) and ids and isinstance(ids[0], bytes):
+        return ids[0]
+    return b""
+
+
+def _parse_from_trailer(parser: _PDFObjectParser) -> Optional[Dict[str, Any]]:
+    """Find the encryption dictionary through startxref and the trailer
+
+    Returns:
+        The encryption dictionary, or None if the trailer has no /Encrypt
+        entry or could not be located
+    """
+    data = parser.data
+    match = None
+    for match in _STARTXREF_RE.finditer(data, max(0, len(data) - _TAIL_SIZE)):
+        pass
+    if match is None:
+        return None
+
+    xref = _CrossReference(parser)
+    pos = parser.skip_whitespace(int(match.group(1)))
+    if data[pos:pos + 4] == b"xref":
+        trailer = xref.read_section(pos)
+
+        # Earlier sections hold the objects an incremental update left alone
+        seen = {pos}
+        previous = trailer.get("/Prev")
+        while isinstance(previous, int) and previous not in seen:
+            seen.add(previous)
+            previous_pos = parser.skip_whitespace(previous)
+            if data[previous_pos:previous_pos + 4] != b"xref":
+                break
+            previous = xref.read_section(previous_pos).get("/Prev")
+    else:
+        # Cross-reference stream: its dictionary doubles as the trailer
+        header = _OBJECT_HEADER_RE.match(data, pos)
+        if not header:
+            return None
+        trailer, _ = parser.parse(header.end())
+        if not isinstance(trailer, dict):
+            return None
+
+    if "/Encrypt" not in trailer:
+        return None
+    encrypt = xref.resolve(trailer["/Encrypt"])
+    if not isinstance(encrypt, dict):
+        raise ValueError("Encryption dictionary is not a dictionary")
+
+    for key in _ENCRYPT_KEYS:
+        if key in encrypt:
+            encrypt[key] = xref.resolve(encrypt[key])
+    encrypt["/ID"] = _first_document_id(xref.resolve(trailer.get("/ID")))
+    return encrypt
+
+
+def _parse_from_scan(parser: _PDFObjectParser) -> Optional[Dict[str, Any]]:
+    """Find the encryption dictionary by scanning the whole file
+
+    Returns:
+        The encryption dictionary, or None if the PDF has no /Encrypt entry
+    """
+    data = parser.data
+
+    # The last trailer wins when the file has incremental updates
+    ref_match = None
+    for ref_match in _ENCRYPT_REF_RE.finditer(data):
+        pass
+    direct_match = None
+    for direct_match in _ENCRYPT_DIRECT_RE.finditer(data):
+        pass
+
+    if ref_match and (not direct_match or ref_match.start() > direct_match.start()):
+        encrypt = parser.find_object(int(ref_match.group(1)), int(ref_match.group(2)))
+    elif direct_match:
+        encrypt, _ = parser.parse(direct_match.end() - 2)
+    else:
+        return None
+
+    if not isinstance(encrypt, dict):
+        raise ValueError("Encryption dictionary is not a dictionary")
+
+    # Resolve indirect values that we need
+    for key in _ENCRYPT_KEYS:
+        value = encrypt.get(key)
+        if isinstance(value, tuple) and value[0] == "ref":
+            encrypt[key] = parser.find_object(value[1], value[2])
+
+    id_match = None
+    for id_match in _ID_RE.finditer(data):
+        pass
+    document_id = b""
+    if id_match:
+        ids, _ = parser.parse(id_match.end() - 1)
+        document_id = _first_document_id(ids)
+    encrypt["/ID"] = document_id
+
+    return encrypt
+
+
+def parse_encrypt(pdf_path: str) -> Optional[Dict[str, Any]]:
+    """Read the encryption dictionary and document ID of a PDF
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        The encryption dictionary with an extra "/ID" entry holding the first
+        document ID string, or None if the PDF has no /Encrypt entry
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is empty or its /Encrypt entry is malformed
+    """
+    with open(pdf_path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with data:
+        parser = _PDFObjectParser(data)
+        try:
+            encrypt = _parse_from_trailer(parser)
+        except (ValueError, IndexError):
+            encrypt = None
+
+        # Confirm a missing /Encrypt with a full scan, since a damaged
+        # startxref would otherwise hide it
+        if encrypt is None:
+            try:
+                encrypt = _parse_from_scan(parser)
+            except IndexError:
+                # Data cut off in the middle of an object
+                raise ValueError("Unexpected end of data")
+        return encrypt
@@ -5,10 +5,73 @@ This module provides various strategies for generating passwords to try.
 """
 
 from abc import ABC, abstractmethod
+import bisect
+import hashlib
 import string
+import itertools
 import os
-import random
-from typing import List, Optional, Callable
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .candidate_order import default_date_range, smart_order
+
+
+# Zero-padded decimal strings for every 3-digit suffix, used to build numeric
+# passwords by concatenation instead of formatting each number
+_DECIMAL_SUFFIX_DIGITS = 3
+_DECIMAL_SUFFIXES = [str(i).zfill(_DECIMAL_SUFFIX_DIGITS) for i in range(10 ** _DECIMAL_SUFFIX_DIGITS)]
+_DECIMAL_SUFFIX_BYTES = [suffix.encode("ascii") for suffix in _DECIMAL_SUFFIXES]
+
+# Read buffer for dictionary files
+_DICTIONARY_BUFFER_SIZE = 1 << 20
+
+# Charset generators precompute every 2-character suffix the same way
+_CHARSET_SUFFIX_CHARS = 2
+
+
+def _charset_string(charset: str, position: int, length: int) -> str:
+    """Write position in base len(charset) using charset as the digits"""
+    size = len(charset)
+    chars = []
+    for _ in range(length):
+        position, index = divmod(position, size)
+        chars.append(charset[index])
+    return "".join(reversed(chars))
+
+
+def _charset_batch(charset: str, length: int, suffix_table: List[str],
+                   start_pos: int, count: int) -> List[str]:
+    """Build charset passwords from converted high characters and a suffix table"""
+    if length < _CHARSET_SUFFIX_CHARS:
+        return [_charset_string(charset, i, length) for i in range(start_pos, start_pos + count)]
+    
+    # Convert only the high characters once per suffix block
+    block = len(suffix_table)
+    prefix_length = length - _CHARSET_SUFFIX_CHARS
+    end_pos = start_pos + count
+    result = []
+    for prefix_value in range(start_pos // block, (end_pos - 1) // block + 1):
+        prefix = _charset_string(charset, prefix_value, prefix_length)
+        base = prefix_value * block
+        suffixes = suffix_table[max(start_pos - base, 0):min(end_pos - base, block)]
+        result.extend([prefix + suffix for suffix in suffixes])
+    return result
+
+
+def _unique(candidates: Iterable[str]) -> Iterator[str]:
+    """Yield each candidate the first time it appears"""
+    seen = set()
+    for candidate in candidates:
+        if candidate not in seen:
+            seen.add(candidate)
+            yield candidate
+
+
+def _with_transforms(words: Iterable[str], transforms: List[Callable[[str], str]]) -> Iterator[str]:
+    """Yield each word followed by each of its transforms"""
+    for word in words:
+        yield word
+        for transform in transforms:
+            yield transform(word)
 
 
 class PasswordGenerator(ABC):
@@ -33,6 +96,16 @@ class PasswordGenerator(ABC):
     def password_to_position(self, password: str) -> int:
         """Convert a password to its numeric position"""
         pass
+    
+    def get_state_params(self) -> Optional[Dict[str, Any]]:
+        """Get parameters that identify the candidate list, for saved state
+        
+        Two generators with the same type, count and parameters must produce
+        the same passwords in the same order. Returns None when the generator
+        cannot say, in which case a finished run is never treated as already
+        searched.
+        """
+        return None
 
 
 class NumericPasswordGenerator(PasswordGenerator):
@@ -44,12 +117,38 @@ class NumericPasswordGenerator(PasswordGenerator):
         
     def generate(self, start_pos: int, count: int) -> List[str]:
         """Generate a batch of passwords from a starting position"""
-        return [str(i).zfill(self.length) for i in range(start_pos, start_pos + count)]
+        return self._generate(start_pos, count, "%0*d", _DECIMAL_SUFFIXES)
+    
+    def generate_bytes(self, start_pos: int, count: int) -> List[bytes]:
+        """Generate a batch of passwords as ASCII bytes from a starting position"""
+        return self._generate(start_pos, count, b"%0*d", _DECIMAL_SUFFIX_BYTES)
+    
+    def _generate(self, start_pos: int, count: int, number_format, suffix_table) -> list:
+        """Build passwords from formatted high digits and a low-digit table"""
+        if self.length < _DECIMAL_SUFFIX_DIGITS:
+            return [number_format % (self.length, i) for i in range(start_pos, start_pos + count)]
+        
+        # Format only the high digits once per 1000 passwords and append the
+        # precomputed low digits
+        block = len(suffix_table)
+        prefix_length = self.length - _DECIMAL_SUFFIX_DIGITS
+        end_pos = start_pos + count
+        result = []
+        for prefix_value in range(start_pos // block, (end_pos - 1) // block + 1):
+            prefix = number_format % (prefix_length, prefix_value) if prefix_length else number_format[:0]
+            base = prefix_value * block
+            suffixes = suffix_table[max(start_pos - base, 0):min(end_pos - base, block)]
+            result.extend([prefix + suffix for suffix in suffixes])
+        return result
     
     def get_total_count(self) -> int:
         """Get the total number of possible passwords"""
         return 10 ** self.length
     
+    def get_state_params(self) -> Optional[Dict[str, Any]]:
+        """Get parameters that identify the candidate list, for saved state"""
+        return {"length": self.length}
+    
     def position_to_password(self, position: int) -> str:
         """Convert a numeric position to a password"""
         return str(position).zfill(self.length)
@@ -78,26 +177,24 @@ class AlphabeticPasswordGenerator(PasswordGenerator):
         if not self.charset:
             raise ValueError("At least one character set must be enabled")
         self.charset_size = len(self.charset)
+        self.char_values = {char: i for i, char in enumerate(self.charset)}
+        self.suffix_table = ["".join(chars) for chars in itertools.product(self.charset, repeat=_CHARSET_SUFFIX_CHARS)]
         
     def generate(self, start_pos: int, count: int) -> List[str]:
         """Generate a batch of passwords from a starting position"""
-        result = []
-        for i in range(start_pos, start_pos + count):
-            result.append(self.position_to_password(i))
-        return result
+        return _charset_batch(self.charset, self.length, self.suffix_table, start_pos, count)
     
     def get_total_count(self) -> int:
         """Get the total number of possible passwords"""
         return self.charset_size ** self.length
     
+    def get_state_params(self) -> Optional[Dict[str, Any]]:
+        """Get parameters that identify the candidate list, for saved state"""
+        return {"length": self.length, "charset": self.charset}
+    
     def position_to_password(self, position: int) -> str:
         """Convert a numeric position to a password"""
-        result = ""
-        temp = position
-        for _ in range(self.length):
-            result = self.charset[temp % self.charset_size] + result
-            temp //= self.charset_size
-        return result
+        return _charset_string(self.charset, position, self.length)
     
     def password_to_position(self, password: str) -> int:
         """Convert a password to its numeric position"""
@@ -106,9 +203,10 @@ class AlphabeticPasswordGenerator(PasswordGenerator):
         
         position = 0
         for char in password:
-            if char not in self.charset:
+            value = self.char_values.get(char)
+            if value is None:
                 raise ValueError(f"Invalid character in password: {char}")
-            position = position * self.charset_size + self.charset.index(char)
+            position = position * self.charset_size + value
         return position
 
 
@@ -131,26 +229,24 @@ class AlphanumericPasswordGenerator(PasswordGenerator):
         if not self.charset:
             raise ValueError("At least one character set must be enabled")
         self.charset_size = len(self.charset)
+        self.char_values = {char: i for i, char in enumerate(self.charset)}
+        self.suffix_table = ["".join(chars) for chars in itertools.product(self.charset, repeat=_CHARSET_SUFFIX_CHARS)]
         
     def generate(self, start_pos: int, count: int) -> List[str]:
         """Generate a batch of passwords from a starting position"""
-        result = []
-        for i in range(start_pos, start_pos + count):
-            result.append(self.position_to_password(i))
-        return result
+        return _charset_batch(self.charset, self.length, self.suffix_table, start_pos, count)
     
     def get_total_count(self) -> int:
         """Get the total number of possible passwords"""
         return self.charset_size ** self.length
     
+    def get_state_params(self) -> Optional[Dict[str, Any]]:
+        """Get parameters that identify the candidate list, for saved state"""
+        return {"length": self.length, "charset": self.charset}
+    
     def position_to_password(self, position: int) -> str:
         """Convert a numeric position to a password"""
-        result = ""
-        temp = position
-        for _ in range(self.length):
-            result = self.charset[temp % self.charset_size] + result
-            temp //= self.charset_size
-        return result
+        return _charset_string(self.charset, position, self.length)
     
     def password_to_position(self, password: str) -> int:
         """Convert a password to its numeric position"""
@@ -159,9 +255,10 @@ class AlphanumericPasswordGenerator(PasswordGenerator):
         
         position = 0
         for char in password:
-            if char not in self.charset:
+            value = self.char_values.get(char)
+            if value is None:
                 raise ValueError(f"Invalid character in password: {char}")
-            position = position * self.charset_size + self.charset.index(char)
+            position = position * self.charset_size + value
         return position
 
 
@@ -176,19 +273,25 @@ class DictionaryPasswordGenerator(PasswordGenerator):
         self.dictionary_path = dictionary_path
         self.transforms = transforms or []
         
-        # Load words and apply transforms
-        with open(dictionary_path, 'r', encoding='utf-8', errors='ignore') as f:
-            self.words = [line.strip() for line in f if line.strip()]
+        # Load words and apply transforms; reading and splitting the whole
+        # file at once keeps the per-line work out of the interpreter
+        with open(dictionary_path, 'rb', buffering=_DICTIONARY_BUFFER_SIZE) as f:
+            text = f.read().decode('utf-8', errors='ignore')
+        if '\r' in text:
+            # Same line endings as text mode: \r\n, \r and \n
+            text = text.replace('\r', '\n')
+        self.words = [word for word in map(str.strip, text.split('\n')) if word]
             
-        # Apply transforms to generate more password candidates
-        transformed_words = []
-        for word in self.words:
-            transformed_words.append(word)
-            for transform in self.transforms:
-                transformed_words.append(transform(word))
+        # Apply transforms to generate more password candidates, streaming
+        # them into the de-duplication instead of listing them all first
+        transformed_words = _with_transforms(self.words, self.transforms)
                 
-        self.passwords = list(set(transformed_words))  # Remove duplicates
+        # Remove duplicates but keep file order, so positions mean the same
+        # thing in every process and across resumed runs
+        self.passwords = list(dict.fromkeys(transformed_words))
         self.password_count = len(self.passwords)
+        self._positions = None  # password -> position, built on first lookup
+        self._digest = None  # digest of the candidate list, built on first use
         
     def generate(self, start_pos: int, count: int) -> List[str]:
         """Generate a batch of passwords from a starting position"""
@@ -199,6 +302,17 @@ class DictionaryPasswordGenerator(PasswordGenerator):
         """Get the total number of possible passwords"""
         return self.password_count
     
+    def get_state_params(self) -> Optional[Dict[str, Any]]:
+        """Get parameters that identify the candidate list, for saved state
+        
+        The candidates are identified by a digest of the list itself, which
+        covers the file contents and the transforms applied to them.
+        """
+        if self._digest is None:
+            candidates = "\n".join(self.passwords).encode("utf-8", "surrogatepass")
+            self._digest = hashlib.md5(candidates).hexdigest()
+        return {"candidates_md5": self._digest}
+    
     def position_to_password(self, position: int) -> str:
         """Convert a numeric position to a password"""
         if position < 0 or position >= self.password_count:
@@ -207,9 +321,11 @@ class DictionaryPasswordGenerator(PasswordGenerator):
     
     def password_to_position(self, password: str) -> int:
         """Convert a password to its numeric position"""
+        if self._positions is None:
+            self._positions = {candidate: i for i, candidate in enumerate(self.passwords)}
         try:
-            return self.passwords.index(password)
-        except ValueError:
+            return self._positions[password]
+        except KeyError:
             raise ValueError(f"Password not found in dictionary: {password}")
 
 
@@ -222,12 +338,10 @@ class CompositePasswordGenerator(PasswordGenerator):
             raise ValueError("At least one generator must be provided")
         self.generators = generators
         
-        # Calculate cumulative counts for mapping positions to generators
-        self.cumulative_counts = [0]
-        total = 0
-        for gen in self.generators:
-            total += gen.get_total_count()
-            self.cumulative_counts.append(total)
+        # Calculate cumulative counts for mapping positions to generators; kept
+        # as Python ints since long charset spaces overflow 64 bits
+        self.generator_counts = [gen.get_total_count() for gen in self.generators]
+        self.cumulative_counts = [0, *itertools.accumulate(self.generator_counts)]
         
     def generate(self, start_pos: int, count: int) -> List[str]:
         """Generate a batch of passwords from a starting position"""
@@ -240,7 +354,7 @@ class CompositePasswordGenerator(PasswordGenerator):
             gen = self.generators[gen_idx]
             
             # Calculate how many passwords to generate from this generator
-            gen_remaining = gen.get_total_count() - local_pos
+            gen_remaining = self.generator_counts[gen_idx] - local_pos
             batch_count = min(remaining, gen_remaining)
             
             # Generate passwords from this generator
@@ -261,18 +375,25 @@ class CompositePasswordGenerator(PasswordGenerator):
         """Get the total number of possible passwords"""
         return self.cumulative_counts[-1]
     
+    def get_state_params(self) -> Optional[Dict[str, Any]]:
+        """Get parameters that identify the candidate list, for saved state"""
+        parts = []
+        for gen in self.generators:
+            params = gen.get_state_params()
+            if params is None:
+                return None
+            parts.append([gen.__class__.__name__, gen.get_total_count(), params])
+        return {"generators": parts}
+    
     def _find_generator_and_position(self, global_pos: int):
         """Find which generator contains the given position and the local position within it"""
         if global_pos < 0 or global_pos >= self.get_total_count():
             raise ValueError(f"Position must be between 0 and {self.get_total_count()-1}")
-            
-        for i in range(len(self.generators)):
-            if global_pos < self.cumulative_counts[i+1]:
-                local_pos = global_pos - self.cumulative_counts[i]
-                return i, local_pos
-                
-        # This should never happen
-        raise RuntimeError("Could not find generator for position")
+        
+        # The last cumulative count at or below the position starts its generator
+        i = bisect.bisect_right(self.cumulative_counts, global_pos) - 1
+        local_pos = global_pos - self.cumulative_counts[i]
+        return i, local_pos
     
     def position_to_password(self, position: int) -> str:
         """Convert a numeric position to a password"""
@@ -295,52 +416,22 @@ class CompositePasswordGenerator(PasswordGenerator):
 class SmartPasswordGenerator(PasswordGenerator):
     """Smart password generator that uses common patterns and heuristics"""
     
-    def __init__(self, max_passwords: int = 1000000):
-        """Initialize with maximum number of passwords to generate"""
-        self.max_passwords = max_passwords
-        
-        # Generate passwords based on common patterns
-        self.passwords = []
-        
-        # Common patterns: birth years (1950-2023)
-        for year in range(1950, 2024):
-            self.passwords.append(str(year))
+    def __init__(self, max_passwords: int = 1000000, date_range: Optional[Tuple[int, int]] = None):
+        """Initialize with maximum number of passwords to generate
         
-        # Common numeric patterns (123456, etc.)
-        for i in range(4, 9):
-            self.passwords.append(''.join(str(j % 10) for j in range(i)))
-            self.passwords.append(''.join(str(9 - (j % 10)) for j in range(i)))
-        
-        # Repeated digits (1111, 2222, etc.)
-        for digit in range(10):
-            for length in range(4, 9):
-                self.passwords.append(str(digit) * length)
-        
-        # Common number sequences
-        common_sequences = [
-            "123123", "112233", "121212", "123321", "654321",
-            "789456", "456789", "147258", "258369", "159753"
-        ]
-        self.passwords.extend(common_sequences)
-        
-        # Dates in various formats (MMDDYYYY, DDMMYYYY, etc.)
-        for year in range(1950, 2024):
-            for month in range(1, 13):
-                for day in range(1, 29):  # Most months have at least 28 days
-                    # MMDDYYYY
-                    self.passwords.append(f"{month:02d}{day:02d}{year}")
-                    # DDMMYYYY
-                    self.passwords.append(f"{day:02d}{month:02d}{year}")
-                    # MMDDYY
-                    self.passwords.append(f"{month:02d}{day:02d}{year % 100:02d}")
-                    # DDMMYY
-                    self.passwords.append(f"{day:02d}{month:02d}{year % 100:02d}")
+        Args:
+            max_passwords: Maximum number of passwords to generate
+            date_range: Tuple of (first year, last year) for date patterns
+        """
+        self.max_passwords = max_passwords
+        self.date_range = date_range or default_date_range()
         
-        # Limit to max passwords
-        random.shuffle(self.passwords)  # Randomize to get a good distribution
-        self.passwords = self.passwords[:self.max_passwords]
-        self.passwords.sort()  # Sort for consistent order
+        # Keep the likelihood order, dropping repeats, and stop drawing
+        # candidates once the limit is reached
+        passwords = _unique(smart_order(self.date_range))
+        self.passwords = list(itertools.islice(passwords, self.max_passwords))
         self.password_count = len(self.passwords)
+        self._positions = None  # password -> position, built on first lookup
         
     def generate(self, start_pos: int, count: int) -> List[str]:
         """Generate a batch of passwords from a starting position"""
@@ -351,6 +442,11 @@ class SmartPasswordGenerator(PasswordGenerator):
         """Get the total number of possible passwords"""
         return self.password_count
     
+    def get_state_params(self) -> Optional[Dict[str, Any]]:
+        """Get parameters that identify the candidate list, for saved state"""
+        first_year, last_year = self.date_range
+        return {"first_year": first_year, "last_year": last_year}
+    
     def position_to_password(self, position: int) -> str:
         """Convert a numeric position to a password"""
         if position < 0 or position >= self.password_count:
@@ -359,7 +455,9 @@ class SmartPasswordGenerator(PasswordGenerator):
     
     def password_to_position(self, password: str) -> int:
         """Convert a password to its numeric position"""
+        if self._positions is None:
+            self._positions = {candidate: i for i, candidate in enumerate(self.passwords)}
         try:
-            return self.passwords.index(password)
-        except ValueError:
+            return self._positions[password]
+        except KeyError:
             raise ValueError(f"Password not found in generator: {password}")
\ No newline at end of file
@@ -21,6 +21,7 @@ class StateManager:
         """Initialize with PDF path and optional state directory"""
         self.pdf_path = pdf_path
         self.state_dir = state_dir or os.path.dirname(os.path.abspath(pdf_path))
+        self._filenames = {}  # (generator type, frozen params) -> state file
         
         # Create state directory if it doesn't exist
         try:
@@ -38,6 +39,25 @@ class StateManager:
         Returns:
             Path to the state file
         """
+        # Every periodic save of a run asks for the same file, so remember it.
+        # Value types are part of the key because 1 and 1.0 serialize
+        # differently; parameters with unhashable values are not cached
+        try:
+            params = generator_params or {}
+            key = (generator_type, frozenset((name, type(value), value) for name, value in params.items()))
+            return self._filenames[key]
+        except TypeError:
+            key = None
+        except KeyError:
+            pass
+        
+        state_file = self._build_state_filename(generator_type, generator_params)
+        if key is not None:
+            self._filenames[key] = state_file
+        return state_file
+        
+    def _build_state_filename(self, generator_type: str = None, generator_params: Dict[str, Any] = None) -> str:
+        """Build the state filename; see get_state_filename"""
         pdf_name = os.path.basename(self.pdf_path)
         sanitized_name = ''.join(c if c.isalnum() else '_' for c in pdf_name)
         
@@ -56,25 +76,40 @@ class StateManager:
                   current_position: int,
                   passwords_tried: int,
                   start_time: float,
-                  extra_data: Optional[Dict[str, Any]] = None) -> None:
-        """Save the current state to a file"""
+                  extra_data: Optional[Dict[str, Any]] = None,
+                  sync: bool = False) -> None:
+        """Save the current state to a file
+        
+        Args:
+            sync: Whether to fsync the file before returning, for final saves
+        """
+        now = time.time()
         state = {
             "pdf_path": self.pdf_path,
             "generator_type": generator_type,
             "generator_params": generator_params,
             "current_position": current_position,
             "passwords_tried": passwords_tried,
-            "elapsed_time": time.time() - start_time,
-            "timestamp": time.time()
+            "elapsed_time": now - start_time,
+            "timestamp": now
         }
         
         if extra_data:
             state.update(extra_data)
         
         state_file = self.get_state_filename(generator_type, generator_params)
+        
+        # The file is only read back by load_state, so write it compactly in
+        # one go, then rename it into place so a crash never leaves it torn
+        payload = json.dumps(state, separators=(",", ":")).encode()
+        temp_file = f"{state_file}.tmp"
         try:
-            with open(state_file, "w") as f:
-                json.dump(state, f, indent=2)
+            with open(temp_file, "wb") as f:
+                f.write(payload)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_file, state_file)
         except Exception as e:
             raise StateIOError(f"Failed to save state: {e}")
     
@@ -4,22 +4,32 @@ Worker module for the PDF Password Cracker.
 This module contains functions for worker processes that try passwords in parallel.
 """
 
-import multiprocessing
-from typing import List, Optional
+import gc
+import io
+import os
+import pickle
+import signal
+import sys
+from typing import List, Optional, Union
 import pikepdf
 import time
 
+from .encryption import StandardSecurityHandler
+from .generator import NumericPasswordGenerator
 
-def attempt_password(pdf_path: str, password: str) -> bool:
+
+def attempt_password(pdf_path: Union[str, bytes], password: str) -> bool:
     """Try a single password on the PDF
     
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, or its contents
         password: Password to try
         
     Returns:
         True if password is correct, False otherwise
     """
+    if isinstance(pdf_path, bytes):
+        pdf_path = io.BytesIO(pdf_path)
     try:
         with pikepdf.open(pdf_path, password=password) as pdf:
             return True
@@ -30,47 +40,254 @@ def attempt_password(pdf_path: str, password: str) -> bool:
         return False
 
 
-def worker_process(pdf_path: str, 
-                  passwords: List[str], 
-                  result_queue: multiprocessing.Queue,
-                  progress_queue: multiprocessing.Queue,
-                  report_frequency: int = 100,
-                  worker_id: Optional[int] = None) -> None:
-    """Worker process that tries a batch of passwords
+def find_password(pdf_path: Union[str, bytes],
+                  passwords: List[Union[str, bytes]],
+                  security_handler: Optional[StandardSecurityHandler] = None) -> Optional[str]:
+    """Find the correct password in a list of candidates
     
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, or its contents
         passwords: List of passwords to try
-        result_queue: Queue to report found password
-        progress_queue: Queue to report progress
-        report_frequency: How often to report progress
-        worker_id: Optional ID for this worker
+        security_handler: Optional handler to verify passwords without opening the PDF
+        
+    Returns:
+        The correct password (as given) if found, None otherwise
+    """
+    if security_handler is None:
+        for password in passwords:
+            if attempt_password(pdf_path, password):
+                return password
+        return None
+    
+    # Confirm direct matches with a real open before trusting them
+    while passwords:
+        index = security_handler.find_match(passwords)
+        if index is None:
+            return None
+        if attempt_password(pdf_path, passwords[index]):
+            return passwords[index]
+        passwords = passwords[index + 1:]
+    return None
+
+
+# Each worker's progress counter gets a 128-byte slot of its own, so updates
+# from different cores never touch the same cache line
+COUNTER_STRIDE = 16
+
+# Workers grow their report chunk until one takes about this long, so fast
+# checks publish progress (and look for the found flag) a few times per
+# progress refresh instead of every few hundred microseconds
+REPORT_SECONDS = 0.1
+MAX_REPORT_FREQUENCY = 1 << 20
+
+def _cpus_by_core(cpus) -> List[int]:
+    """Order CPUs so every physical core comes before any second SMT thread
+    
+    Args:
+        cpus: CPU numbers the process may run on
+        
+    Returns:
+        The CPUs, first thread of each core first; sorted if topology is unknown
+    """
+    threads_seen = {}
+    ranked = []
+    for cpu in sorted(cpus):
+        topology = f"/sys/devices/system/cpu/cpu{cpu}/topology/"
+        try:
+            with open(topology + "physical_package_id") as f:
+                package_id = f.read().strip()
+            with open(topology + "core_id") as f:
+                core = (package_id, f.read().strip())
+        except OSError:
+            core = cpu
+        thread = threads_seen.get(core, 0)
+        threads_seen[core] = thread + 1
+        ranked.append((thread, cpu))
+    return [cpu for _, cpu in sorted(ranked)]
+
+
+# Per-process state set up once by init_worker
+_worker_pdf_path = None
+_worker_generator = None
+_worker_security_handler = None
+_worker_progress_counters = None
+_worker_slot = None
+_worker_tried = 0
+_worker_report_frequency = 100
+_worker_numeric_scanner = None
+_worker_found_flag = None
+_worker_run_barrier = None
+
+
+def init_worker(pdf_path: str,
+                generator,
+                security_handler: Optional[StandardSecurityHandler],
+                progress_counters,
+                slot_counter,
+                report_frequency: int = 100,
+                numeric_scanner=None,
+                found_flag=None,
+                run_barrier=None) -> None:
+    """Initializer for pool worker processes
+    
+    Stores the per-run state in module globals so each task only carries
+    its batch position. A pool that is kept for several runs can start
+    without a generator and switch runs with load_run.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        generator: Password generator to draw batches from
+        security_handler: Optional handler to verify passwords without opening the PDF
+        progress_counters: Shared array with a per-worker password count every COUNTER_STRIDE entries
+        slot_counter: Shared integer used to hand out counter slots
+        report_frequency: Initial number of passwords between progress reports
+        numeric_scanner: Optional native scanner for numeric generators
+        found_flag: Optional shared byte set to 1 once any worker finds the password
+        run_barrier: Optional barrier for all pool workers, used by load_run
+    """
+    global _worker_progress_counters, _worker_slot, _worker_found_flag, _worker_run_barrier
+    
+    # Let the parent process handle Ctrl+C and save state; the pool's
+    # terminate() must still be able to stop the worker
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    
+    with slot_counter.get_lock():
+        _worker_slot = slot_counter.value
+        slot_counter.value += 1
+    
+    # Keep each worker on its own core so its hashing state stays in cache,
+    # filling physical cores before their hyper-threads
+    if hasattr(os, "sched_setaffinity"):
+        cpus = _cpus_by_core(os.sched_getaffinity(0))
+        try:
+            os.sched_setaffinity(0, {cpus[_worker_slot % len(cpus)]})
+        except OSError:
+            pass
+    
+    # Workers are single-threaded, so GIL switching only costs time; the
+    # cyclic GC is switched per run in _set_run
+    sys.setswitchinterval(1.0)
+    
+    _worker_progress_counters = progress_counters
+    _worker_found_flag = found_flag
+    _worker_run_barrier = run_barrier
+    if generator is not None:
+        _set_run(pdf_path, generator, security_handler, report_frequency, numeric_scanner)
+
+
+def _set_run(pdf_path: str,
+             generator,
+             security_handler: Optional[StandardSecurityHandler],
+             report_frequency: int,
+             numeric_scanner) -> None:
+    """Store the state of one crack run in the worker's globals"""
+    global _worker_pdf_path, _worker_generator, _worker_security_handler
+    global _worker_report_frequency, _worker_numeric_scanner
+    
+    # Without a security handler every candidate is opened with pikepdf, so
+    # read the file once rather than once per password. Those opens leave
+    # reference cycles (QPDF objects, exception tracebacks) and need the
+    # cyclic GC; direct and native checks create none, so it only costs
+    # time there. pikepdf then only confirms a match, which ends the run.
+    if security_handler is None:
+        with open(pdf_path, "rb") as f:
+            pdf_path = f.read()
+        gc.enable()
+    else:
+        gc.disable()
+    
+    _worker_pdf_path = pdf_path
+    _worker_generator = generator
+    _worker_security_handler = security_handler
+    _worker_report_frequency = report_frequency
+    _worker_numeric_scanner = numeric_scanner
+
+
+def load_run(run_state: bytes) -> None:
+    """Pool task that switches this worker to a new crack run
+    
+    The caller sends one task per worker. Each waits on the run barrier
+    until all have started, so no worker can take two and every worker
+    loads the run.
+    
+    Args:
+        run_state: Pickled arguments for _set_run, pickled once by the caller
     """
-    total = len(passwords)
-    start_time = time.time()
-    last_report_time = start_time
-    
-    # Create an identifying prefix for this worker
-    worker_prefix = f"Worker-{worker_id}: " if worker_id is not None else ""
-    
-    for i, password in enumerate(passwords):
-        # Update progress based on frequency (or every 0.5 seconds)
-        current_time = time.time()
-        if i % report_frequency == 0 or i == total - 1 or current_time - last_report_time >= 0.5:
-            progress = min(i % report_frequency + 1 if i % report_frequency > 0 else report_frequency, 
-                          total - (i - i % report_frequency))
-            progress_queue.put(progress)
-            last_report_time = current_time
+    _set_run(*pickle.loads(run_state))
+    _worker_run_barrier.wait()
+
+
+def _find_in_range(start_pos: int, count: int) -> Optional[str]:
+    """Find the correct password among count passwords from start_pos"""
+    if _worker_numeric_scanner is None:
+        if _worker_security_handler is None or not isinstance(_worker_generator, NumericPasswordGenerator):
+            passwords = _worker_generator.generate(start_pos, count)
+            return find_password(_worker_pdf_path, passwords, _worker_security_handler)
+        
+        # Digits are ASCII, so the handler can hash them without encoding each one
+        passwords = _worker_generator.generate_bytes(start_pos, count)
+        password = find_password(_worker_pdf_path, passwords, _worker_security_handler)
+        return None if password is None else password.decode("ascii")
+    
+    # Confirm native matches with a real open before trusting them
+    end_pos = start_pos + count
+    while start_pos < end_pos:
+        index = _worker_numeric_scanner.scan(start_pos, end_pos - start_pos)
+        if index is None:
+            return None
+        password = _worker_generator.position_to_password(start_pos + index)
+        if attempt_password(_worker_pdf_path, password):
+            return password
+        start_pos += index + 1
+    return None
+
+
+def worker_process(start_pos: int, count: int) -> Optional[str]:
+    """Pool task that tries a batch of passwords
+    
+    Args:
+        start_pos: Position of the first password in the generator
+        count: Number of passwords to try
         
-        # Try the password
-        if attempt_password(pdf_path, password):
+    Returns:
+        The correct password if found, None otherwise
+    """
+    global _worker_tried, _worker_report_frequency
+    
+    start_time = time.perf_counter()
+    worker_prefix = f"Worker-{_worker_slot}: "
+    
+    # Check passwords in chunks, reporting progress after each one; each
+    # chunk is timed from the end of the previous one, one clock read per chunk
+    offset = 0
+    chunk_start = start_time
+    while offset < count:
+        # Stop early once another worker has found the password
+        if _worker_found_flag is not None and _worker_found_flag.value:
+            return None
+        
+        chunk_count = min(_worker_report_frequency, count - offset)
+        password = _find_in_range(start_pos + offset, chunk_count)
+        if password is not None:
+            if _worker_found_flag is not None:
+                _worker_found_flag.value = 1
             print(f"{worker_prefix}Found password: {password}")
-            result_queue.put(password)
-            return
+            return password
+        _worker_tried += chunk_count
+        _worker_progress_counters[_worker_slot * COUNTER_STRIDE] = _worker_tried
+        offset += chunk_count
+        
+        # Report less often while full chunks finish well inside REPORT_SECONDS
+        chunk_end = time.perf_counter()
+        if (chunk_count == _worker_report_frequency and
+                _worker_report_frequency < MAX_REPORT_FREQUENCY and
+                chunk_end - chunk_start < REPORT_SECONDS / 2):
+            _worker_report_frequency *= 2
+        chunk_start = chunk_end
     
-    # Signal completion of batch with no success
-    result_queue.put(None)
-    print(f"{worker_prefix}Completed {total} passwords in {time.time() - start_time:.2f} seconds")
+    print(f"{worker_prefix}Completed {count} passwords in {chunk_start - start_time:.2f} seconds")
+    return None
 
 
 class PasswordTester:
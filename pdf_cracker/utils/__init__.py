@@ -11,5 +11,17 @@ from .exceptions import (
     StateIOError,
     WorkerError,
     ConfigError,
+    HashcatError,
+)
+from .logger import (
+    Logger,
+    LazyString,
+    configure_default,
+    debug,
+    info,
+    warning,
+    error,
+    critical,
+    is_debug,
+    set_level,
 )
-from .logger import Logger, debug, info, warning, error, critical
@@ -14,7 +14,7 @@ class Config:
     DEFAULT_CONFIG = {
         "processes": None,  # Use CPU count - 1 by default
         "batch_size": 10000,
-        "save_interval": 5,  # seconds
+        "save_interval": 60,  # seconds
         "state_dir": None,  # Use PDF directory by default
         "verbosity": "info",
         "log_file": None,
@@ -3,35 +3,46 @@ Custom exceptions for the PDF Password Cracker.
 """
 
 class PDFCrackerError(Exception):
-    """Base exception for PDF cracker errors"""
-    pass
+    """Base exception for PDF cracker errors
+    
+    Raise these only for setup, configuration and I/O failures. Per-attempt
+    results never go through exceptions: password checks return a plain
+    bool, so a wrong guess costs a comparison, not a raise and catch.
+    """
+    __slots__ = ()
 
 
 class PDFNotFoundError(PDFCrackerError):
     """PDF file not found"""
-    pass
+    __slots__ = ()
 
 
 class PDFNotEncryptedError(PDFCrackerError):
     """PDF is not encrypted"""
-    pass
+    __slots__ = ()
 
 
 class InvalidPasswordGeneratorError(PDFCrackerError):
     """Invalid password generator configuration"""
-    pass
+    __slots__ = ()
 
 
 class StateIOError(PDFCrackerError):
     """Error reading or writing state file"""
-    pass
+    __slots__ = ()
 
 
 class WorkerError(PDFCrackerError):
     """Error in worker process"""
-    pass
+    __slots__ = ()
 
 
 class ConfigError(PDFCrackerError):
     """Error in configuration"""
-    pass
\ No newline at end of file
+    __slots__ = ()
+
+
+class HashcatError(PDFCrackerError):
+    """Error running hashcat"""
+    __slots__ = ()
+
@@ -2,10 +2,169 @@
 Logging utilities for the PDF Password Cracker.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-from typing import Optional
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+# Records waiting for the background log writer; further records are dropped
+# rather than blocking the caller when the writer falls this far behind
+LOG_QUEUE_SIZE = 10000
+
+
+class CachedFormatter(logging.Formatter):
+    """Formatter for the cracker's log line layout
+    
+    Builds the line with an f-string and only re-renders the timestamp when
+    the second changes, instead of calling strftime for every record.
+    """
+    
+    def __init__(self):
+        super().__init__('%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                         datefmt='%Y-%m-%d %H:%M:%S')
+        # (second, rendered timestamp), swapped as one tuple so threads sharing
+        # the formatter never pair a second with another second's text
+        self._stamp = (None, '')
+    
+    def format(self, record):
+        sec = int(record.created)
+        stamp = self._stamp
+        if stamp[0] != sec:
+            stamp = (sec, time.strftime(self.datefmt, self.converter(sec)))
+            self._stamp = stamp
+        line = f"{stamp[1]} - {record.name} - {record.levelname} - {record.getMessage()}"
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line = f"{line}\n{record.exc_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+        return line
+
+
+# Formatter shared by every Logger's handlers
+_FORMATTER = CachedFormatter()
+
+# Name of the logger behind the module-level shortcuts
+DEFAULT_LOGGER_NAME = "pdf_cracker"
+
+# Whether the default logger emits debug records, kept up to date whenever its
+# level is set so hot loops can check it without calling into logging
+_DEBUG_ENABLED = False
+
+# Background writers by logger name, so re-initialising a logger stops the
+# writer it replaces
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+class LazyString:
+    """Message argument whose text is only built when a handler formats it
+    
+    Use it for expensive debug output, e.g.
+    ``logger.debug("%s", LazyString(lambda: describe(state)))``; when the
+    record is filtered out by level the function is never called.
+    """
+    
+    __slots__ = ('_fn',)
+    
+    def __init__(self, fn: Callable[[], str]):
+        self._fn = fn
+    
+    def __str__(self):
+        return self._fn()
+
+
+class BatchingFileHandler(logging.Handler):
+    """File handler that buffers formatted records and writes them in batches
+    
+    Records are written once ``batch`` of them have collected, or at the
+    latest ``interval`` seconds after they were emitted. The file is only
+    created when the first record arrives.
+    """
+    
+    def __init__(self, filename: str, batch: int = 100, interval: float = 0.5):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.batch = batch
+        self.interval = interval
+        self._fp = None
+        self._buf = []
+        self._buf_lock = threading.Lock()
+        self._closed = threading.Event()
+    
+    def _open(self):
+        """Create the log directory and file and start the periodic flusher"""
+        log_dir = os.path.dirname(self.baseFilename)
+        if not os.path.isdir(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
+        self._fp = open(self.baseFilename, 'a', encoding='utf-8', buffering=1 << 20)
+        threading.Thread(target=self._flush_loop, args=(self.interval,), daemon=True).start()
+    
+    def _flush_loop(self, interval: float):
+        while not self._closed.wait(interval):
+            self.flush()
+    
+    def emit(self, record):
+        try:
+            line = self.format(record) + '\n'
+            if self._fp is None:
+                self._open()
+        except Exception:
+            self.handleError(record)
+            return
+        with self._buf_lock:
+            self._buf.append(line)
+            full = len(self._buf) >= self.batch
+        if full:
+            self.flush()
+    
+    def flush(self):
+        with self._buf_lock:
+            lines, self._buf = self._buf, []
+        if lines:
+            with self.lock:
+                self._fp.writelines(lines)
+                self._fp.flush()
+    
+    def close(self):
+        self._closed.set()
+        self.flush()
+        with self.lock:
+            if self._fp is not None:
+                self._fp.close()
+        super().close()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full
+    
+    The listener thread that passes records on to ``handlers`` is only started
+    with the first record, so a logger that never logs never starts it.
+    """
+    
+    def __init__(self, logger_name: str, *handlers: logging.Handler):
+        super().__init__(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+        self._logger_name = logger_name
+        self._listener = logging.handlers.QueueListener(self.queue, *handlers,
+                                                        respect_handler_level=True)
+        self._started = False
+    
+    def enqueue(self, record):
+        if not self._started:
+            with self.lock:
+                if not self._started:
+                    self._listener.start()
+                    _listeners[self._logger_name] = self._listener
+                    self._started = True
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
 
 
 class Logger:
@@ -18,7 +177,7 @@ class Logger:
     ERROR = logging.ERROR
     CRITICAL = logging.CRITICAL
     
-    def __init__(self, name: str = "pdf_cracker", log_file: Optional[str] = None, 
+    def __init__(self, name: str = DEFAULT_LOGGER_NAME, log_file: Optional[str] = None, 
                  level: int = logging.INFO, console: bool = True):
         """Initialize the logger
         
@@ -31,65 +190,98 @@ class Logger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
         self.logger.propagate = False
+        if name == DEFAULT_LOGGER_NAME:
+            global _DEBUG_ENABLED
+            _DEBUG_ENABLED = level <= logging.DEBUG
         
-        # Clear any existing handlers
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
+        # Setting up the same outputs again, e.g. for every cracker on the same
+        # file, keeps the handlers that are already in place. The console is
+        # whatever sys.stdout is now, so a replaced stdout gets a new handler.
+        outputs = (log_file, sys.stdout if console else None)
+        if getattr(self.logger, '_pdf_cracker_outputs', None) == outputs:
+            return
+        self.logger._pdf_cracker_outputs = outputs
         
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        # Clear any existing handlers
+        while self.logger.handlers:
+            self.logger.removeHandler(self.logger.handlers[-1])
+        listener = _listeners.pop(name, None)
+        if listener:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
         
-        # Add console handler if requested
+        # Add console handler if requested; it writes synchronously so log
+        # lines stay in order with print() output and the progress bar. The
+        # logger's own level does the filtering for all handlers.
         if console:
             console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(level)
-            console_handler.setFormatter(formatter)
+            console_handler.setFormatter(_FORMATTER)
             self.logger.addHandler(console_handler)
         
-        # Add file handler if log file is specified
+        # Add file handler if log file is specified. It runs on a background
+        # listener thread, so callers only pay for putting the record on a
+        # queue. Neither the file nor the thread exist until something is logged.
         if log_file:
-            # Create directory if it doesn't exist
-            log_dir = os.path.dirname(log_file)
-            if log_dir:
-                os.makedirs(log_dir, exist_ok=True)
-                
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(level)
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            file_handler = BatchingFileHandler(log_file)
+            file_handler.setFormatter(_FORMATTER)
+            self.logger.addHandler(DroppingQueueHandler(name, file_handler))
     
     def get_logger(self):
         """Get the logger instance"""
         return self.logger
 
 
-# Create a default logger for simple usage
-default_logger = Logger().get_logger()
+def _stop_listeners():
+    """Flush and stop every background log writer"""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
 
 
-def debug(msg: str, *args, **kwargs):
-    """Log a debug message"""
-    default_logger.debug(msg, *args, **kwargs)
+atexit.register(_stop_listeners)
 
 
-def info(msg: str, *args, **kwargs):
-    """Log an info message"""
-    default_logger.info(msg, *args, **kwargs)
+# Default logger for simple usage. As a library it only has a NullHandler, so
+# nothing is formatted or printed until the application configures logging,
+# either its own way or through configure_default().
+default_logger = logging.getLogger(DEFAULT_LOGGER_NAME)
+default_logger.addHandler(logging.NullHandler())
 
 
-def warning(msg: str, *args, **kwargs):
-    """Log a warning message"""
-    default_logger.warning(msg, *args, **kwargs)
+def configure_default(log_file: Optional[str] = None, level: int = logging.INFO):
+    """Send the default logger's records to the console and optionally a file
+    
+    Args:
+        log_file: Optional file to log to
+        level: Logging level
+        
+    Returns:
+        The default logger
+    """
+    return Logger(DEFAULT_LOGGER_NAME, log_file=log_file, level=level).get_logger()
+
 
+def set_level(level: int):
+    """Set the level of the default logger"""
+    global _DEBUG_ENABLED
+    default_logger.setLevel(level)
+    _DEBUG_ENABLED = default_logger.isEnabledFor(logging.DEBUG)
 
-def error(msg: str, *args, **kwargs):
-    """Log an error message"""
-    default_logger.error(msg, *args, **kwargs)
+
+def is_debug() -> bool:
+    """Whether the default logger emits debug messages
+    
+    Cheaper than a debug() call that gets filtered out, for use in hot loops:
+    ``if is_debug(): debug("%s", LazyString(...))``.
+    """
+    return _DEBUG_ENABLED
 
 
-def critical(msg: str, *args, **kwargs):
-    """Log a critical message"""
-    default_logger.critical(msg, *args, **kwargs)
\ No newline at end of file
+# Module-level shortcuts are the default logger's own bound methods, so a
+# call goes straight to logging without an extra wrapper frame
+debug = default_logger.debug
+info = default_logger.info
+warning = default_logger.warning
+error = default_logger.error
+critical = default_logger.critical
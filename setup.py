@@ -2,7 +2,7 @@
 Setup script for the PDF Password Cracker package.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -16,7 +16,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/vkhydras/pdf_cracker.git",
-    packages=find_packages(),
+    packages=["pdf_cracker", "pdf_cracker.core", "pdf_cracker.utils"],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -27,8 +27,13 @@ setup(
     python_requires=">=3.6",
     install_requires=[
         "pikepdf>=2.0.0",
+        "cryptography>=3.1",
         "tqdm>=4.50.0",
     ],
+    extras_require={
+        "fast": ["numba>=0.57"],
+        "test": ["pytest"],
+    },
     entry_points={
         "console_scripts": [
             "pdf-cracker=pdf_cracker.cli:main",
@@ -0,0 +1,42 @@
+"""
+Shared fixtures for the PDF Password Cracker tests.
+"""
+
+import pikepdf
+import pytest
+
+
+# (revision, AES) combinations pikepdf can write with the Standard Security Handler
+RC4_REVISIONS = [(2, False), (3, False), (4, False), (4, True)]
+REVISIONS = RC4_REVISIONS + [(6, True)]
+
+
+def _revision_id(param):
+    revision, aes = param
+    return f"R{revision}-{'aes' if aes else 'rc4'}"
+
+
+@pytest.fixture(params=REVISIONS, ids=_revision_id)
+def revision(request):
+    """Every (revision, AES) combination"""
+    return request.param
+
+
+@pytest.fixture(params=RC4_REVISIONS, ids=_revision_id)
+def md5_revision(request):
+    """The MD5-based revisions 2-4, which the numeric scan supports"""
+    return request.param
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """Build encrypted one-page PDFs in the test's temporary directory"""
+    def make(password, revision=4, aes=False, xref_stream=False, name="test.pdf"):
+        path = tmp_path / name
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        mode = pikepdf.ObjectStreamMode.generate if xref_stream else pikepdf.ObjectStreamMode.disable
+        encryption = pikepdf.Encryption(user=password, owner="owner", R=revision, aes=aes, metadata=aes)
+        pdf.save(path, encryption=encryption, object_stream_mode=mode)
+        return str(path)
+    return make
@@ -0,0 +1,22 @@
+"""
+Tests for the command line interface.
+"""
+
+import sys
+
+from pdf_cracker import cli
+from pdf_cracker.core import hashcat
+from pdf_cracker.core.cracker import PDFCracker
+
+
+def test_gpu_without_hashcat_exits(make_pdf, monkeypatch, tmp_path):
+    path = make_pdf("12", revision=4)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(hashcat, "find_hashcat", lambda: None)
+    # Record whether the CLI went on to crack on the CPU
+    calls = []
+    monkeypatch.setattr(PDFCracker, "crack_with_strategy", lambda *args, **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(sys, "argv", ["pdf-cracker", path, "--gpu", "--digits", "2"])
+
+    assert cli.main() == 1
+    assert calls == []
@@ -0,0 +1,43 @@
+"""
+Tests for running the worker pool.
+"""
+
+import logging
+import time
+
+from pdf_cracker.core import _hotloop
+from pdf_cracker.core.cracker import PDFCracker
+from pdf_cracker.core.generator import NumericPasswordGenerator
+
+
+def test_kept_pool_measures_speed_per_run(make_pdf, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Check candidates in Python so no run waits on compiling the native scan
+    monkeypatch.setattr(_hotloop, "supports", lambda *args: False)
+    cracker = PDFCracker(make_pdf("x"), processes=2, logger=logging.getLogger("pdf_cracker.tests"))
+
+    reports = []
+    batch_size_for_speed = cracker._batch_size_for_speed
+
+    def spy(speed, total_passwords):
+        reports.append((speed, total_passwords, time.time()))
+        return batch_size_for_speed(speed, total_passwords)
+
+    monkeypatch.setattr(cracker, "_batch_size_for_speed", spy)
+
+    cracker._keep_pool = True
+    try:
+        assert cracker.crack(NumericPasswordGenerator(4), ignore_state=True) is None
+        second_run_start = time.time()
+        assert cracker.crack(NumericPasswordGenerator(2), ignore_state=True) is None
+    finally:
+        cracker._keep_pool = False
+        cracker._cleanup_processes()
+
+    # Speed times elapsed time is the number of passwords counted for the run.
+    # The second run only has 100, so even measured from before the run
+    # started it stays far below the first run's 10,000.
+    second_run = [(speed, report_time) for speed, total, report_time in reports if total == 100]
+    assert second_run
+    for speed, report_time in second_run:
+        assert speed * (report_time - second_run_start) < 1_000
@@ -0,0 +1,47 @@
+"""
+Tests for reading the encryption dictionary.
+"""
+
+import pikepdf
+import pytest
+
+from pdf_cracker.core.encparse import parse_encrypt
+from pdf_cracker.core.encryption import StandardSecurityHandler
+
+
+@pytest.mark.parametrize("xref_stream", [False, True])
+def test_parse_encrypt(make_pdf, revision, xref_stream):
+    path = make_pdf("s3cret", *revision, xref_stream=xref_stream)
+    with open(path, "rb") as f:
+        assert (b"/XRef" in f.read()) == xref_stream
+
+    encrypt = parse_encrypt(path)
+    assert encrypt["/Filter"] == "/Standard"
+    assert encrypt["/R"] == revision[0]
+    assert len(encrypt["/ID"]) == 16
+    assert StandardSecurityHandler.from_dict(encrypt).check_password("s3cret")
+
+
+@pytest.mark.parametrize("xref_stream", [False, True])
+def test_parse_encrypt_unencrypted(tmp_path, xref_stream):
+    path = tmp_path / "plain.pdf"
+    pdf = pikepdf.new()
+    pdf.add_blank_page()
+    mode = pikepdf.ObjectStreamMode.generate if xref_stream else pikepdf.ObjectStreamMode.disable
+    pdf.save(path, object_stream_mode=mode)
+    assert parse_encrypt(str(path)) is None
+
+
+def test_truncated_pdf(make_pdf, tmp_path):
+    with open(make_pdf("s3cret"), "rb") as f:
+        data = f.read()
+    path = tmp_path / "truncated.pdf"
+    for size in range(0, len(data), 7):
+        path.write_bytes(data[:size])
+        # Damaged files are reported as ValueError, never as a stray IndexError
+        try:
+            parse_encrypt(str(path))
+        except ValueError:
+            pass
+        handler = StandardSecurityHandler.from_pdf(str(path))
+        assert handler is None or isinstance(handler, StandardSecurityHandler)
@@ -0,0 +1,21 @@
+"""
+Tests for the direct password checks.
+"""
+
+from pdf_cracker.core.encryption import StandardSecurityHandler
+
+
+def test_check_password(make_pdf, revision):
+    handler = StandardSecurityHandler.from_pdf(make_pdf("s3cret", *revision))
+    assert handler.revision == revision[0]
+    assert handler.check_password("s3cret")
+    assert handler.check_password(b"s3cret")
+    assert not handler.check_password("s3cre")
+    assert not handler.check_password("")
+
+
+def test_find_match(make_pdf, revision):
+    handler = StandardSecurityHandler.from_pdf(make_pdf("s3cret", *revision))
+    assert handler.find_match(["a", b"b", "s3cret", "s3cret"]) == 2
+    assert handler.find_match(["a", "b"]) is None
+    assert handler.find_match([]) is None
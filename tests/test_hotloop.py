@@ -0,0 +1,25 @@
+"""
+Tests for the native numeric scan.
+"""
+
+import pytest
+
+from pdf_cracker.core import _hotloop
+from pdf_cracker.core.encryption import StandardSecurityHandler
+
+
+def test_numeric_scan_agrees_with_check_password(make_pdf, md5_revision):
+    if not _hotloop.AVAILABLE:
+        pytest.skip("numba is not installed")
+    handler = StandardSecurityHandler.from_pdf(make_pdf("0427", *md5_revision))
+    scanner = _hotloop.NumericScanner(handler, 4)
+    assert scanner.scan(0, 10000) == 427
+    assert scanner.scan(400, 100) == 27
+    assert scanner.scan(428, 9572) is None
+    assert scanner.scan(0, 427) is None
+    assert handler.check_password("%04d" % (400 + scanner.scan(400, 100)))
+
+
+def test_numeric_scan_rejects_r6(make_pdf):
+    handler = StandardSecurityHandler.from_pdf(make_pdf("0427", 6, True))
+    assert not _hotloop.supports(handler, 4)
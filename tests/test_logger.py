@@ -0,0 +1,23 @@
+"""
+Tests for the logging setup.
+"""
+
+import io
+import sys
+
+from pdf_cracker.utils.logger import Logger
+
+
+def test_console_follows_replaced_stdout(monkeypatch):
+    first, second = io.StringIO(), io.StringIO()
+
+    monkeypatch.setattr(sys, "stdout", first)
+    Logger("pdf_cracker.tests.console").get_logger().info("first")
+
+    # Same outputs again after stdout was replaced
+    monkeypatch.setattr(sys, "stdout", second)
+    Logger("pdf_cracker.tests.console").get_logger().info("second")
+
+    assert "first" in first.getvalue()
+    assert "second" in second.getvalue()
+    assert "second" not in first.getvalue()
@@ -0,0 +1,145 @@
+"""
+Tests for skipping and resuming runs from saved state.
+"""
+
+import logging
+import os
+
+import pytest
+
+from pdf_cracker.core.cracker import PDFCracker
+from pdf_cracker.core.generator import (
+    AlphabeticPasswordGenerator,
+    DictionaryPasswordGenerator,
+    NumericPasswordGenerator,
+    PasswordGenerator,
+)
+from pdf_cracker.core.state import StateManager
+
+SKIPPED = "already tried in an earlier run"
+
+
+class ListGenerator(PasswordGenerator):
+    """Generator that cannot identify its candidates for saved state"""
+
+    def __init__(self, passwords):
+        self.passwords = passwords
+
+    def generate(self, start_pos, count):
+        return self.passwords[start_pos:start_pos + count]
+
+    def get_total_count(self):
+        return len(self.passwords)
+
+    def position_to_password(self, position):
+        return self.passwords[position]
+
+    def password_to_position(self, password):
+        return self.passwords.index(password)
+
+
+@pytest.fixture
+def cracker(make_pdf, tmp_path, monkeypatch):
+    # Found passwords are written to the working directory
+    monkeypatch.chdir(tmp_path)
+    logger = logging.getLogger("pdf_cracker.tests")
+    logger.setLevel(logging.INFO)
+    return PDFCracker(make_pdf("1234"), processes=2, logger=logger)
+
+
+def write_words(tmp_path, name, words):
+    path = tmp_path / name
+    path.write_text("\n".join(words) + "\n")
+    return str(path)
+
+
+def state_files(cracker):
+    return [name for name in os.listdir(os.path.dirname(cracker.pdf_path)) if name.endswith(".json")]
+
+
+def test_resume_starts_from_saved_position(cracker):
+    generator = NumericPasswordGenerator(4)
+    params = {"total_count": generator.get_total_count(), **generator.get_state_params()}
+    state_manager = StateManager(cracker.pdf_path)
+
+    # Saved past the password, so the resumed run cannot find it
+    state_manager.save_state("NumericPasswordGenerator", params, 5000, 5000, 0.0)
+    assert cracker.crack(generator) is None
+
+    # Saved before it, so it is found
+    state_manager.save_state("NumericPasswordGenerator", params, 1000, 1000, 0.0)
+    assert cracker.crack(generator) == "1234"
+
+    # Starting over ignores the saved position
+    state_manager.save_state("NumericPasswordGenerator", params, 5000, 5000, 0.0)
+    assert cracker.crack(generator, ignore_state=True) == "1234"
+
+
+def test_saved_count_excludes_batches_in_flight(cracker):
+    generator = NumericPasswordGenerator(4)
+    state_manager = StateManager(cracker.pdf_path)
+    cracker.generator_type = "NumericPasswordGenerator"
+    cracker.generator_params = {"total_count": generator.get_total_count(), **generator.get_state_params()}
+
+    # Resumed at 1,000 and now at 3,000, with 2,600 more passwords tested in
+    # batches that have not finished
+    cracker._run_start_position = 1000
+    cracker._run_start_tried = 1000
+    cracker.current_position = 3000
+    cracker.total_passwords_tried = 5600
+    cracker.start_time = 0.0
+    cracker._save_current_state(sync=True)
+
+    state = state_manager.load_state(cracker.generator_type, cracker.generator_params)
+    assert state["current_position"] == 3000
+    assert state["passwords_tried"] == 3000
+
+
+def test_finished_state_is_saved_only_when_identified(cracker):
+    assert cracker.crack(NumericPasswordGenerator(3)) is None
+    assert len(state_files(cracker)) == 1
+
+    assert cracker.crack(ListGenerator(["aaa", "bbb"])) is None
+    assert len(state_files(cracker)) == 1
+
+
+def test_exhausted_run_is_skipped(cracker, tmp_path, caplog):
+    words = write_words(tmp_path, "d1.txt", ["aaa", "bbb", "ccc"])
+    assert cracker.crack(DictionaryPasswordGenerator(words)) is None
+    caplog.clear()
+    assert cracker.crack(DictionaryPasswordGenerator(words)) is None
+    assert SKIPPED in caplog.text
+
+
+def test_same_size_dictionary_is_not_skipped(cracker, tmp_path, caplog):
+    first = write_words(tmp_path, "d1.txt", ["aaa", "bbb", "ccc"])
+    second = write_words(tmp_path, "d2.txt", ["xxx", "1234", "zzz"])
+    assert cracker.crack(DictionaryPasswordGenerator(first)) is None
+    caplog.clear()
+    assert cracker.crack(DictionaryPasswordGenerator(second)) == "1234"
+    assert SKIPPED not in caplog.text
+
+
+def test_charset_is_part_of_the_state_key():
+    lower = AlphabeticPasswordGenerator(2, lowercase=True, uppercase=False)
+    upper = AlphabeticPasswordGenerator(2, lowercase=False, uppercase=True)
+    assert lower.get_total_count() == upper.get_total_count()
+    assert lower.get_state_params() != upper.get_state_params()
+
+
+def test_unidentified_generator_is_never_skipped(cracker, caplog):
+    assert cracker.crack(ListGenerator(["aaa", "bbb"])) is None
+    caplog.clear()
+    assert cracker.crack(ListGenerator(["aaa", "bbb"])) is None
+    assert SKIPPED not in caplog.text
+
+
+def test_dictionary_state_key_follows_the_word_list(tmp_path):
+    words = write_words(tmp_path, "d1.txt", ["abc", "def"])
+    same_words = write_words(tmp_path, "d2.txt", ["abc", "def"])
+    other_words = write_words(tmp_path, "d3.txt", ["abc", "xyz"])
+    key = DictionaryPasswordGenerator(words).get_state_params()
+
+    assert DictionaryPasswordGenerator(same_words).get_state_params() == key
+    assert DictionaryPasswordGenerator(other_words).get_state_params() != key
+    assert DictionaryPasswordGenerator(words, transforms=[str.upper]).get_state_params() != key
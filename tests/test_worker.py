@@ -0,0 +1,27 @@
+"""
+Tests for the worker-side run setup.
+"""
+
+import gc
+
+from pdf_cracker.core import worker
+from pdf_cracker.core.encryption import StandardSecurityHandler
+from pdf_cracker.core.generator import NumericPasswordGenerator
+
+
+def test_cyclic_gc_stays_on_for_pikepdf_checks(make_pdf):
+    path = make_pdf("12")
+    generator = NumericPasswordGenerator(2)
+    was_enabled = gc.isenabled()
+    try:
+        worker._set_run(path, generator, StandardSecurityHandler.from_pdf(path), 100, None)
+        assert not gc.isenabled()
+
+        worker._set_run(path, generator, None, 100, None)
+        assert gc.isenabled()
+        assert worker.find_password(worker._worker_pdf_path, ["00", "12"]) == "12"
+    finally:
+        if was_enabled:
+            gc.enable()
+        else:
+            gc.disable()